@@ -1,323 +1,454 @@
-from typing import Dict, List, Any, Optional, Union
+import asyncio
+import base64
+import functools
+import mimetypes
+import os
+import re
+import threading
+from typing import Annotated, AsyncIterator, Dict, List, Any, Optional, Tuple, TypedDict, Union
 from langgraph.graph import StateGraph, END
+from langgraph.graph.message import add_messages
 from langchain_core.messages import HumanMessage, AIMessage, BaseMessage
 from langchain_ollama import ChatOllama
-from langchain_core.output_parsers import StrOutputParser
-from langchain_core.runnables import RunnablePassthrough
+from langchain_core.runnables import RunnableConfig
 import logging
-from dataclasses import dataclass
 from datetime import datetime
-from PIL import Image
-import requests
 from memory import ArtHistoryMemory
 from tools import ArtAnalysisTools
 from vision_tools import VisionAnalysisTools
-from prompt_templates import PromptTemplates
+from prompt_templates import templates
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
-class AgentState:
-    """Enhanced state for Professor Helena agent with vision capabilities"""
-    messages: List[BaseMessage]
-    artwork_context: Optional[Dict[str, Any]] = None
-    image_analysis: Optional[Dict[str, Any]] = None
-    visual_elements: Optional[Dict[str, Any]] = None
-    historical_perspectives: List[Dict[str, Any]] = None
-    current_analysis: Optional[str] = None
-    critique_complete: bool = False
-    discussion_mode: bool = False
-    has_image: bool = False
+_CRITIQUE_SECTIONS_RE = re.compile(
+    r"<ANALYSIS>(.*?)</ANALYSIS>.*?<PERSPECTIVES>(.*?)</PERSPECTIVES>.*?<SYNTHESIS>(.*?)</SYNTHESIS>",
+    re.S
+)
+# Just the inline base64 data URI, so a long message is never copied whole
+_DATA_IMAGE_RE = re.compile(r"data:image/[^;]+;base64,[A-Za-z0-9+/=]+", re.I)
+# A path/URL ending in an image extension
+_IMAGE_PATH_RE = re.compile(r"\.(?:jpg|jpeg|png|gif|bmp)\s*$", re.I)
+_SYNTHESIS_OPEN = "<SYNTHESIS>"
+_SYNTHESIS_CLOSE = "</SYNTHESIS>"
+
+class AgentState(TypedDict, total=False):
+    """
+    Enhanced state for Professor Helena agent with vision capabilities
+    Nodes return only the keys they change and LangGraph merges them in;
+    new messages are appended through the add_messages reducer
+    """
+    messages: Annotated[List[BaseMessage], add_messages]
+    artwork_context: Optional[Dict[str, Any]]
+    image_analysis: Optional[Dict[str, Any]]
+    visual_elements: Optional[Dict[str, Any]]
+    historical_perspectives: List[Dict[str, Any]]
+    current_analysis: Optional[str]
+    critique_complete: bool
+    discussion_mode: bool
+    has_image: bool
+    image_data: Optional[str]
+
+
+@functools.lru_cache(maxsize=64)
+def _encode_image(path: str, mtime: float, size: int) -> str:
+    """
+    Read an image file once and return it as a base64 data URI
+    mtime and size are part of the cache key, so an edited file is re-read
+    """
+    mime = mimetypes.guess_type(path)[0] or "image/jpeg"
+    with open(path, "rb") as f:
+        encoded = base64.b64encode(f.read()).decode("ascii")
+    return f"data:{mime};base64,{encoded}"
+
+
+def _image_to_data_uri(image_path: str) -> str:
+    """Data URI for a local image file; URLs and missing paths are passed through"""
+    try:
+        stat = os.stat(image_path)
+    except OSError:
+        return image_path
+    return _encode_image(image_path, stat.st_mtime, stat.st_size)
+
+
+def _get_helena(config: RunnableConfig) -> "ProfessorHelena":
+    """The agent instance bound to this run (see ProfessorHelena.__init__)"""
+    return config["configurable"]["helena"]
+
+
+async def process_input(state: AgentState, config: RunnableConfig) -> Dict[str, Any]:
+    """Process input and detect if image is present"""
+    helena = _get_helena(config)
+    logger.info("Professor Helena: Processing input...")
+    
+    messages = state.get("messages")
+    last_message = messages[-1] if messages else None
+    
+    # Check if message contains image, keeping the data for the vision step
+    has_image, image_data = helena._parse_image(last_message)
+    
+    if has_image:
+        logger.info("Professor Helena: Image detected, preparing for visual analysis...")
+    
+    return {"has_image": has_image, "image_data": image_data}
+
+
+async def analyze_image_content(state: AgentState, helena: "ProfessorHelena") -> Dict[str, Any]:
+    """Analyze the visual content of the artwork image"""
+    logger.info("Professor Helena: Analyzing visual content...")
+    
+    # Parsed once in process_input
+    image_data = state.get("image_data")
+    
+    if image_data:
+        # Comprehensive visual analysis using vision model
+        visual_analysis_prompt = helena.prompts.get_visual_analysis_prompt()
+        
+        # Create message with image for vision model
+        vision_message = helena._create_vision_message(visual_analysis_prompt, image_data)
+        
+        # Bound concurrent vision calls to what the backend can hold in VRAM
+        async with helena._vision_semaphore:
+            visual_analysis = (await helena.vision_llm.ainvoke([vision_message])).content
+        
+        # Extract structured visual elements; regex parsing runs in a worker
+        # thread so it does not stall other requests on the event loop
+        visual_elements = await asyncio.to_thread(
+            helena.vision_tools.parse_visual_elements, visual_analysis
+        )
+        
+        logger.info("Professor Helena: Visual analysis complete")
+        
+        return {
+            "image_analysis": {
+                "raw_analysis": visual_analysis,
+                "timestamp": datetime.now().isoformat()
+            },
+            "visual_elements": visual_elements
+        }
+    
+    return {}
+
+
+async def produce_full_critique(state: AgentState, config: RunnableConfig) -> Dict[str, Any]:
+    """Analysis, historical perspectives and synthesis in a single model call"""
+    helena = _get_helena(config)
+    logger.info("Professor Helena: Beginning comprehensive artwork analysis...")
+    
+    messages = state.get("messages")
+    last_message = helena._get_message_text(messages[-1]) if messages else ""
+    
+    # Vision analysis, text extraction and the historical context search
+    # are independent, so run them together instead of back to back.
+    # The search therefore uses the text description only.
+    image_task = None
+    async with asyncio.TaskGroup() as tg:
+        if state.get("has_image"):
+            image_task = tg.create_task(analyze_image_content(state, helena))
+        info_task = tg.create_task(
+            asyncio.to_thread(helena.tools.extract_artwork_info, last_message)
+        )
+        search_task = tg.create_task(
+            asyncio.to_thread(helena.memory.search_similar_artworks, last_message)
+        )
+    
+    artwork_info = info_task.result()
+    relevant_docs = search_task.result()
+    image_updates = image_task.result() if image_task else {}
+    visual_elements = image_updates.get("visual_elements")
+    image_analysis = image_updates.get("image_analysis")
+    
+    # Enhance with visual information if available
+    if visual_elements:
+        artwork_info.update({
+            "visual_analysis": image_analysis,
+            "formal_elements": visual_elements
+        })
+    
+    # One prompt yields all three sections, so the shared context is prefilled once;
+    # its formatters run concurrently off the event loop
+    critique_prompt = await helena.prompts.aget_unified_critique_prompt(
+        artwork_info,
+        relevant_docs,
+        visual_elements,
+        image_analysis
+    )
+    
+    # Streamed so analyze_artwork_stream callers receive tokens as they arrive
+    chunks = []
+    async for chunk in helena.text_llm.astream(critique_prompt):
+        chunks.append(chunk.content)
+    response = "".join(chunks)
+    
+    analysis, perspectives_text, final_critique = helena._split_critique_sections(response)
+    perspectives = await asyncio.to_thread(
+        helena.tools.parse_historical_perspectives, perspectives_text
+    )
+    
+    # Store enhanced analysis in memory off the critical path; keep a
+    # reference so the task is not garbage collected before it finishes
+    store_task = asyncio.create_task(asyncio.to_thread(
+        helena.memory.store_analysis,
+        artwork_info=artwork_info,
+        analysis=final_critique,
+        perspectives=perspectives
+    ))
+    helena._background_tasks.add(store_task)
+    store_task.add_done_callback(helena._background_tasks.discard)
+    
+    return {
+        **image_updates,
+        "artwork_context": artwork_info,
+        "current_analysis": analysis,
+        "historical_perspectives": perspectives,
+        "messages": [AIMessage(content=final_critique)],
+        "critique_complete": True
+    }
+
+
+async def discussion_mode_response(state: AgentState, config: RunnableConfig) -> Dict[str, Any]:
+    """Handle discussion with enhanced visual understanding"""
+    helena = _get_helena(config)
+    logger.info("Professor Helena: Engaging in enhanced discussion mode...")
+    
+    last_message = state["messages"][-1].content
+    
+    discussion_prompt = helena.prompts.get_enhanced_discussion_prompt(
+        last_message,
+        state.get("artwork_context"),
+        state.get("historical_perspectives"),
+        state.get("visual_elements")
+    )
+    
+    response = (await helena.text_llm.ainvoke(discussion_prompt)).content
+    
+    return {"messages": [AIMessage(content=response)]}
+
+
+@functools.cache
+def _get_compiled_graph():
+    """
+    Create the enhanced LangGraph workflow with vision capabilities
+    The graph shape is static, so it is compiled once per process and each
+    ProfessorHelena binds itself through the run config
+    """
+    # Build the enhanced graph
+    workflow = StateGraph(AgentState)
+    
+    # Add nodes
+    workflow.add_node("process_input", process_input)
+    workflow.add_node("produce_full_critique", produce_full_critique)
+    workflow.add_node("discussion", discussion_mode_response)
+    
+    # Add edges
+    workflow.set_entry_point("process_input")
+    
+    # Image analysis runs inside produce_full_critique, concurrently with the text side
+    workflow.add_edge("process_input", "produce_full_critique")
+    workflow.add_edge("produce_full_critique", END)
+    workflow.add_edge("discussion", END)
+    
+    return workflow.compile()
+
 
 class ProfessorHelena:
     """
     Enhanced Professor Helena AI Agent - Art History Expert with Vision
     Specialized in providing scholarly, methodical art analysis with historical context
     Now includes image analysis capabilities using open-source vision models
+
+    All graph nodes are coroutines and call the models via ``ainvoke``, so
+    concurrent requests overlap on the Ollama backend instead of blocking
+    each other. Scale the backend with the Ollama server environment:
+        OLLAMA_NUM_PARALLEL: requests served concurrently per loaded model
+        OLLAMA_MAX_LOADED_MODELS: models kept resident at once (text + vision)
     """
     
+    # Models this process has loaded with a successful warmup, and those with one in flight
+    _warmed_models = set()
+    _warming_models = set()
+    
     def __init__(self, 
                  text_model: str = "llama3.1:8b",
-                 vision_model: str = "llava:13b"):  # or "llama3.2-vision:11b"
+                 vision_model: str = "llava:13b",  # or "llama3.2-vision:11b"
+                 vision_keep_alive: Union[int, str] = "5m",
+                 warmup: bool = True):
         """
         Initialize Professor Helena with vision capabilities
         
         Args:
             text_model: Ollama text model (llama3.1:8b recommended)
             vision_model: Ollama vision model (llava:13b or llama3.2-vision:11b)
+            vision_keep_alive: Idle time after which Ollama unloads the vision model
+                (Ollama duration such as "5m", 0 to unload right after each call)
+            warmup: Load the text model in the background so the first analysis
+                does not pay the model load time
         """
-        # Text-only model for regular analysis
+        # Text-only model for regular analysis, kept resident (keep_alive=-1)
+        # since every request uses it
         self.text_llm = ChatOllama(
             model=text_model,
             temperature=0.7,
-            top_p=0.9
+            top_p=0.9,
+            keep_alive=-1
         )
         
-        # Vision model for image analysis
-        self.vision_llm = ChatOllama(
-            model=vision_model,
-            temperature=0.6,  # Slightly lower for more consistent visual analysis
-            top_p=0.9
-        )
+        # Vision model for image analysis, created on first image (see vision_llm)
+        self._vision_model_name = vision_model
+        self._vision_keep_alive = vision_keep_alive
+        self._vision_llm = None
         
         self.memory = ArtHistoryMemory()
         self.tools = ArtAnalysisTools()
         self.vision_tools = VisionAnalysisTools()
-        self.prompts = PromptTemplates()
+        self.prompts = templates
         
-        # Initialize the enhanced agent graph
-        self.graph = self._create_agent_graph()
+        # GPU-bound vision calls are capped at the backend's parallelism
+        self._vision_semaphore = asyncio.Semaphore(int(os.environ.get("OLLAMA_NUM_PARALLEL", "1")))
         
-    def _create_agent_graph(self) -> StateGraph:
-        """Create the enhanced LangGraph workflow with vision capabilities"""
+        # Fire-and-forget work (memory writes) that must outlive the node that started it
+        self._background_tasks = set()
         
-        def process_input(state: AgentState) -> AgentState:
-            """Process input and detect if image is present"""
-            logger.info("Professor Helena: Processing input...")
-            
-            last_message = state.messages[-1] if state.messages else None
-            
-            # Check if message contains image
-            has_image = self._detect_image_in_message(last_message)
-            state.has_image = has_image
-            
-            if has_image:
-                logger.info("Professor Helena: Image detected, preparing for visual analysis...")
-            
-            return state
+        # Shared compiled graph; nodes find this instance in the run config
+        self.graph = _get_compiled_graph().with_config(configurable={"helena": self})
         
-        def analyze_image_content(state: AgentState) -> AgentState:
-            """Analyze the visual content of the artwork image"""
-            logger.info("Professor Helena: Analyzing visual content...")
-            
-            last_message = state.messages[-1]
-            
-            # Extract image from message
-            image_data = self._extract_image_from_message(last_message)
-            
-            if image_data:
-                # Comprehensive visual analysis using vision model
-                visual_analysis_prompt = self.prompts.get_visual_analysis_prompt()
-                
-                # Create message with image for vision model
-                vision_message = self._create_vision_message(visual_analysis_prompt, image_data)
-                
-                visual_analysis = self.vision_llm.invoke([vision_message]).content
-                
-                # Extract structured visual elements
-                visual_elements = self.vision_tools.parse_visual_elements(visual_analysis)
-                
-                state.image_analysis = {
-                    "raw_analysis": visual_analysis,
-                    "timestamp": datetime.now().isoformat()
-                }
-                state.visual_elements = visual_elements
-                
-                logger.info("Professor Helena: Visual analysis complete")
-            
-            return state
-            
-        def analyze_artwork(state: AgentState) -> AgentState:
-            """Enhanced artwork analysis incorporating visual information"""
-            logger.info("Professor Helena: Beginning comprehensive artwork analysis...")
-            
-            last_message = state.messages[-1].content if state.messages else ""
-            
-            # Extract artwork information from text
-            artwork_info = self.tools.extract_artwork_info(last_message)
-            
-            # Enhance with visual information if available
-            if state.visual_elements:
-                artwork_info.update({
-                    "visual_analysis": state.image_analysis,
-                    "formal_elements": state.visual_elements
-                })
-            
-            # Search for relevant historical context
-            search_query = self._create_enhanced_search_query(artwork_info, state.visual_elements)
-            relevant_docs = self.memory.search_similar_artworks(search_query)
-            
-            # Generate enhanced analysis incorporating visual data
-            analysis_prompt = self.prompts.get_enhanced_analysis_prompt(
-                artwork_info, 
-                relevant_docs,
-                state.visual_elements,
-                state.image_analysis
-            )
-            
-            analysis = self.text_llm.invoke(analysis_prompt).content
-            
-            state.artwork_context = artwork_info
-            state.current_analysis = analysis
-            
-            return state
-            
-        def generate_historical_perspectives(state: AgentState) -> AgentState:
-            """Generate historical perspectives enhanced with visual understanding"""
-            logger.info("Professor Helena: Generating enhanced historical perspectives...")
-            
-            perspectives_prompt = self.prompts.get_enhanced_perspectives_prompt(
-                state.artwork_context, 
-                state.current_analysis,
-                state.visual_elements
-            )
-            
-            perspectives_response = self.text_llm.invoke(perspectives_prompt).content
-            perspectives = self.tools.parse_historical_perspectives(perspectives_response)
-            
-            state.historical_perspectives = perspectives
-            return state
-            
-        def synthesize_critique(state: AgentState) -> AgentState:
-            """Synthesize final critique incorporating all visual and contextual analysis"""
-            logger.info("Professor Helena: Synthesizing comprehensive critique...")
-            
-            synthesis_prompt = self.prompts.get_enhanced_synthesis_prompt(
-                state.artwork_context,
-                state.current_analysis,
-                state.historical_perspectives,
-                state.visual_elements,
-                state.image_analysis
-            )
-            
-            final_critique = self.text_llm.invoke(synthesis_prompt).content
-            
-            # Store enhanced analysis in memory
-            self.memory.store_analysis(
-            artwork_info=state.artwork_context,
-            analysis=final_critique,
-            perspectives=state.historical_perspectives
-            )
-            
-            state.messages.append(AIMessage(content=final_critique))
-            state.critique_complete = True
-            
-            return state
-            
-        def discussion_mode_response(state: AgentState) -> AgentState:
-            """Handle discussion with enhanced visual understanding"""
-            logger.info("Professor Helena: Engaging in enhanced discussion mode...")
-            
-            last_message = state.messages[-1].content
-            
-            discussion_prompt = self.prompts.get_enhanced_discussion_prompt(
-                last_message,
-                state.artwork_context,
-                state.historical_perspectives,
-                state.visual_elements
+        if warmup:
+            self._warm_up(self.text_llm, text_model)
+        
+    @property
+    def vision_llm(self) -> ChatOllama:
+        """Vision model, created on first use so text-only sessions never load it"""
+        if self._vision_llm is None:
+            self._vision_llm = ChatOllama(
+                model=self._vision_model_name,
+                temperature=0.6,  # Slightly lower for more consistent visual analysis
+                top_p=0.9,
+                keep_alive=self._vision_keep_alive
             )
-            
-            response = self.text_llm.invoke(discussion_prompt).content
-            state.messages.append(AIMessage(content=response))
-            
-            return state
-        
-        # Routing functions
-        def should_analyze_image(state: AgentState) -> str:
-            """Route to image analysis if image is present"""
-            if state.has_image:
-                return "analyze_image"
-            return "analyze_artwork"
-            
-        def should_continue_to_artwork_analysis(state: AgentState) -> str:
-            """Continue to artwork analysis after image processing"""
-            return "analyze_artwork"
-            
-        def should_continue_to_perspectives(state: AgentState) -> str:
-            """Decide whether to continue to perspectives generation"""
-            if state.artwork_context and state.current_analysis:
-                return "generate_perspectives"
-            return "end"
-            
-        def should_continue_to_synthesis(state: AgentState) -> str:
-            """Decide whether to continue to synthesis"""
-            if state.historical_perspectives:
-                return "synthesize"
-            return "end"
-        
-        # Build the enhanced graph
-        workflow = StateGraph(AgentState)
-        
-        # Add nodes
-        workflow.add_node("process_input", process_input)
-        workflow.add_node("analyze_image", analyze_image_content)
-        workflow.add_node("analyze_artwork", analyze_artwork)
-        workflow.add_node("generate_perspectives", generate_historical_perspectives)
-        workflow.add_node("synthesize", synthesize_critique)
-        workflow.add_node("discussion", discussion_mode_response)
-        
-        # Add edges with enhanced routing
-        workflow.set_entry_point("process_input")
-        
-        workflow.add_conditional_edges(
-            "process_input",
-            should_analyze_image,
-            {
-                "analyze_image": "analyze_image",
-                "analyze_artwork": "analyze_artwork"
-            }
-        )
+        return self._vision_llm
+    
+    def _warm_up(self, llm: ChatOllama, model_name: str):
+        """Send a tiny prompt without waiting for it so Ollama loads the model"""
+        if model_name in ProfessorHelena._warmed_models or model_name in ProfessorHelena._warming_models:
+            return
+        ProfessorHelena._warming_models.add(model_name)
         
-        workflow.add_edge("analyze_image", "analyze_artwork")
+        def loaded():
+            # Only a successful warmup counts; a failed one is retried next time
+            ProfessorHelena._warmed_models.add(model_name)
+            logger.info(f"Professor Helena: {model_name} loaded")
         
-        workflow.add_conditional_edges(
-            "analyze_artwork",
-            should_continue_to_perspectives,
-            {
-                "generate_perspectives": "generate_perspectives",
-                "end": END
-            }
-        )
+        def failed(e: Exception):
+            logger.warning(f"Professor Helena: Warmup of {model_name} failed: {e}")
         
-        workflow.add_conditional_edges(
-            "generate_perspectives",
-            should_continue_to_synthesis,
-            {
-                "synthesize": "synthesize",
-                "end": END
-            }
-        )
+        async def warm():
+            try:
+                await llm.ainvoke("ok")
+                loaded()
+            except Exception as e:
+                failed(e)
+            finally:
+                ProfessorHelena._warming_models.discard(model_name)
         
-        workflow.add_edge("synthesize", END)
-        workflow.add_edge("discussion", END)
+        def warm_sync():
+            try:
+                llm.invoke("ok")
+                loaded()
+            except Exception as e:
+                failed(e)
+            finally:
+                ProfessorHelena._warming_models.discard(model_name)
         
-        return workflow.compile()
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop yet (plain constructor call); warm in a daemon thread.
+            # The sync client is used so no async connections are bound to a
+            # short-lived loop that the real event loop would later reuse
+            threading.Thread(target=warm_sync, daemon=True).start()
+        else:
+            warm_task = loop.create_task(warm())
+            self._background_tasks.add(warm_task)
+            warm_task.add_done_callback(self._background_tasks.discard)
     
-    def _detect_image_in_message(self, message: BaseMessage) -> bool:
-        """Detect if message contains an image"""
-        if not message:
-            return False
-            
-        # Check for image in message content
-        if hasattr(message, 'content'):
-            if isinstance(message.content, list):
-                return any(
-                    hasattr(item, 'type') and item.type == 'image_url' 
-                    for item in message.content
-                )
-            elif isinstance(message.content, str):
-                # Check for base64 image data or image URLs
-                return ('data:image/' in message.content or 
-                       message.content.lower().endswith(('.jpg', '.jpeg', '.png', '.gif', '.bmp')))
-        
-        return False
-    
-    def _extract_image_from_message(self, message: BaseMessage) -> Optional[str]:
-        """Extract image data from message"""
+    def _parse_image(self, message: BaseMessage) -> Tuple[bool, Optional[str]]:
+        """
+        Detect and extract an image from a message in a single pass
+        
+        Returns:
+            (has_image, image_data) where image_data is the image URL or data URI
+        """
         if not message:
-            return None
-            
-        if hasattr(message, 'content'):
-            if isinstance(message.content, list):
-                for item in message.content:
-                    if hasattr(item, 'type') and item.type == 'image_url':
-                        return item.image_url.url
-            elif isinstance(message.content, str):
-                if 'data:image/' in message.content:
-                    return message.content
+            return False, None
         
-        return None
+        content = getattr(message, 'content', None)
+        if isinstance(content, list):
+            # Content parts may be plain dicts or objects with attributes
+            for item in content:
+                if isinstance(item, dict):
+                    if item.get('type') == 'image_url':
+                        image_url = item.get('image_url')
+                        url = image_url.get('url') if isinstance(image_url, dict) else image_url
+                        return True, url
+                elif getattr(item, 'type', None) == 'image_url':
+                    return True, item.image_url.url
+        elif isinstance(content, str):
+            # Slice out only the data URI rather than returning the whole message
+            match = _DATA_IMAGE_RE.search(content)
+            if match:
+                return True, match.group(0)
+            # A bare path or URL is recognised but cannot be sent to the vision model
+            return bool(_IMAGE_PATH_RE.search(content)), None
+        
+        return False, None
+    
+    def _create_initial_state(self,
+                              artwork_description: str,
+                              image_path: Optional[str] = None,
+                              image_data: Optional[str] = None) -> AgentState:
+        """Build the graph input for an analysis request"""
+        message_content = artwork_description
+        
+        # Prepare message with image if provided; local files are sent as
+        # (cached) data URIs so every image reaches the graph in the same form
+        if image_path or image_data:
+            if image_path:
+                image_url = _image_to_data_uri(image_path)
+            elif image_data.startswith("data:"):
+                image_url = image_data
+            else:
+                image_url = f"data:image/jpeg;base64,{image_data}"
+            
+            message_content = [
+                {"type": "text", "text": artwork_description},
+                {"type": "image_url", "image_url": {"url": image_url}}
+            ]
+        
+        return AgentState(
+            messages=[HumanMessage(content=message_content)],
+            discussion_mode=False
+        )
+    
+    def _split_critique_sections(self, response: str) -> Tuple[str, str, str]:
+        """Split a unified critique into (analysis, perspectives, synthesis)"""
+        match = _CRITIQUE_SECTIONS_RE.search(response)
+        if not match:
+            # Model ignored the section tags; use the whole response for each part
+            logger.warning("Professor Helena: Critique sections not found, using full response")
+            return response, response, response
+        
+        return tuple(section.strip() for section in match.groups())
+    
+    def _get_message_text(self, message: BaseMessage) -> str:
+        """Return the text portion of a message, skipping any image parts"""
+        if isinstance(message.content, str):
+            return message.content
+        
+        return " ".join(
+            item.get("text", "") if isinstance(item, dict) else str(item)
+            for item in message.content
+            if not (isinstance(item, dict) and item.get("type") == "image_url")
+        )
     
     def _create_vision_message(self, prompt: str, image_data: str) -> HumanMessage:
         """Create a message for the vision model"""
@@ -328,23 +459,6 @@ class ProfessorHelena:
             ]
         )
     
-    def _create_enhanced_search_query(self, artwork_info: Dict, visual_elements: Optional[Dict]) -> str:
-        """Create enhanced search query incorporating visual elements"""
-        query_parts = [artwork_info.get("description", "")]
-        
-        if visual_elements:
-            # Add visual elements to search query
-            if "style" in visual_elements:
-                query_parts.append(f"style: {visual_elements['style']}")
-            if "medium" in visual_elements:
-                query_parts.append(f"medium: {visual_elements['medium']}")
-            if "color_palette" in visual_elements:
-                query_parts.append(f"colors: {', '.join(visual_elements['color_palette'])}")
-            if "composition" in visual_elements:
-                query_parts.append(f"composition: {visual_elements['composition']}")
-        
-        return " ".join(query_parts)
-    
     async def analyze_artwork_with_image(self, 
                                        artwork_description: str, 
                                        image_path: Optional[str] = None,
@@ -360,32 +474,103 @@ class ProfessorHelena:
         Returns:
             Comprehensive art historical analysis with visual insights
         """
-        message_content = artwork_description
-        
-        # Prepare message with image if provided
-        if image_path or image_data:
-            if image_path:
-                # Pass the file path directly if your model supports it
-                message_content = [
-                    {"type": "text", "text": artwork_description},
-                    {"type": "image_url", "image_url": {"url": image_path}}
-                ]
-
-        
-        initial_state = AgentState(
-            messages=[HumanMessage(content=message_content)],
-            discussion_mode=False
-        )
+        initial_state = self._create_initial_state(artwork_description, image_path, image_data)
         
         result = await self.graph.ainvoke(initial_state)
         return result['messages'][-1].content
     
+    async def analyze_artwork_stream(self,
+                                     artwork_description: str,
+                                     image_path: Optional[str] = None,
+                                     image_data: Optional[str] = None) -> AsyncIterator[str]:
+        """
+        Analyze an artwork, yielding the final critique as it is generated
+        
+        Args:
+            artwork_description: Text description of the artwork
+            image_path: Path to image file
+            image_data: Base64 encoded image data
+            
+        Yields:
+            Text fragments of the final critique, in order
+        """
+        initial_state = self._create_initial_state(artwork_description, image_path, image_data)
+        
+        # Only the SYNTHESIS section is the critique; the tags may be split across tokens,
+        # so hold back enough text to recognise them before yielding
+        buffer = ""
+        in_synthesis = False
+        synthesis_done = False
+        streamed_any = False
+        final_state = None
+        
+        async for mode, payload in self.graph.astream(initial_state, stream_mode=["messages", "values"]):
+            if mode == "values":
+                final_state = payload
+                continue
+            
+            chunk, metadata = payload
+            if synthesis_done or metadata.get("langgraph_node") != "produce_full_critique" or not chunk.content:
+                continue
+            
+            buffer += chunk.content
+            if not in_synthesis:
+                start = buffer.find(_SYNTHESIS_OPEN)
+                if start == -1:
+                    buffer = buffer[-len(_SYNTHESIS_OPEN):]
+                    continue
+                buffer = buffer[start + len(_SYNTHESIS_OPEN):]
+                in_synthesis = True
+            
+            end = buffer.find(_SYNTHESIS_CLOSE)
+            if end != -1:
+                buffer, synthesis_done = buffer[:end], True
+                ready = len(buffer)
+            else:
+                ready = len(buffer) - len(_SYNTHESIS_CLOSE) + 1
+            
+            if ready > 0:
+                yield buffer[:ready]
+                streamed_any = True
+                buffer = buffer[ready:]
+        
+        # The stream ended inside the synthesis without a closing tag: flush the held-back tail
+        if in_synthesis and not synthesis_done and buffer:
+            yield buffer
+            streamed_any = True
+        
+        # Model ignored the section tags; fall back to the critique the graph settled on
+        if not streamed_any and final_state:
+            yield final_state['messages'][-1].content
+    
     async def analyze_artwork(self, artwork_description: str) -> str:
         """
         Analyze an artwork (text-only, maintains backward compatibility)
         """
         return await self.analyze_artwork_with_image(artwork_description)
-    
+
+    async def analyze_artworks_batch(self, descriptions: List[str]) -> List[str]:
+        """
+        Analyze several artworks at once (text-only)
+
+        All graph runs are submitted together so Ollama can batch the
+        concurrent prompts; set OLLAMA_NUM_PARALLEL to at least len(descriptions)
+        to have them served in the same forward passes.
+
+        Args:
+            descriptions: Text descriptions of the artworks
+
+        Returns:
+            Critiques in the same order as the descriptions
+        """
+        states = [
+            AgentState(messages=[HumanMessage(content=description)], discussion_mode=False)
+            for description in descriptions
+        ]
+
+        results = await asyncio.gather(*[self.graph.ainvoke(state) for state in states])
+        return [result['messages'][-1].content for result in results]
+
     async def discuss_with_peer(self, peer_message: str, artwork_context: Dict[str, Any]) -> str:
         """
         Engage in discussion with another agent about an artwork
@@ -436,6 +621,14 @@ RECOMMENDED OPEN SOURCE MODELS:
    - Faster inference
    - Still good quality for most tasks
 
+VRAM NOTE:
+The vision model is only created when the first image arrives, so text-only
+sessions never load it. Once loaded, Ollama unloads it after
+`vision_keep_alive` of inactivity (default "5m"); pass 0 to free the VRAM
+right after each image, or set OLLAMA_KEEP_ALIVE on the server.
+The text model is used by every request, so it is pinned with keep_alive=-1
+and warmed up when ProfessorHelena is constructed (pass warmup=False to skip).
+
 USAGE:
 ```python
 # Initialize with your preferred models
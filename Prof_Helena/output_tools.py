@@ -1,34 +1,114 @@
-import json
+import functools
 from tools import ArtAnalysisTools
 import sys
 import os
-from docx import Document  # <-- Use this to read .docx files
+import zipfile
+from xml.etree import ElementTree
+
+try:
+    import orjson
+except ImportError:  # stdlib fallback when orjson is not installed
+    orjson = None
+    import json
 
 # Determine the directory where run.py resides
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
-# Construct an absolute path to the .docx file
-doc_path = os.path.join(BASE_DIR, "Data", "Starry_Night.docx")
-
-# Use python-docx to read the document
-doc = Document(doc_path)
-document_text = "\n".join([para.text for para in doc.paragraphs])
-
-# Now use your tool
-tools = ArtAnalysisTools()
-artwork_info = tools.extract_artwork_info(document_text)
-period_from_text = tools._detect_periods_from_text(document_text)
-fuzzy_color = tools._extract_colors_fuzzy(document_text)
-historical_perspective = tools.parse_historical_perspectives(document_text)
-
-
-print("=== TOOLS.PY OUTPUT ===")
-print("ArtAnalysisTools.extract_artwork_info() results:")
-print(json.dumps(artwork_info, indent=2))
-# print("ArtAnalysisTools._determine_periods_with_confidence() results:")
-print("ArtAnalysisTools._detect_periods_from_text() results:")
-print(json.dumps(period_from_text, indent=2))
-print("ArtAnalysisTools._extract_colors_fuzzy() results:")
-print(json.dumps(fuzzy_color, indent=2))
-print("ArtAnalysisTools.parse_historical_perspectives() results:")
-print(json.dumps(historical_perspective, indent=2))
\ No newline at end of file
+
+# WordprocessingML namespace, as used in word/document.xml tags
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+# Run children that contribute text, rendered the way python-docx does
+_RUN_TEXT = {
+    _W + 't': lambda node: node.text or '',
+    _W + 'tab': lambda node: '\t',
+    _W + 'ptab': lambda node: '\t',
+    _W + 'cr': lambda node: '\n',
+    _W + 'noBreakHyphen': lambda node: '-',
+    # Only line breaks count; page and column breaks add no text
+    _W + 'br': lambda node: '\n' if node.get(_W + 'type', 'textWrapping') == 'textWrapping' else ''
+}
+
+
+def _paragraph_text(paragraph):
+    """Text of a <w:p>: its runs, including those inside hyperlinks, in document order"""
+    parts = []
+    for child in paragraph:
+        if child.tag == _W + 'r':
+            runs = (child,)
+        elif child.tag == _W + 'hyperlink':
+            runs = child.iterfind(_W + 'r')
+        else:
+            continue
+        for run in runs:
+            parts.extend(_RUN_TEXT[node.tag](node) for node in run if node.tag in _RUN_TEXT)
+    return ''.join(parts)
+
+
+def _dump(obj):
+    """Write obj to stdout as indented JSON, using orjson when available"""
+    if orjson is not None:
+        # orjson produces UTF-8 bytes; flush pending text so output stays in order
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+    else:
+        # Same text as the former print(json.dumps(obj, indent=2)), non-ASCII escaped
+        json.dump(obj, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+
+@functools.lru_cache(maxsize=4)
+def load_doc(path):
+    """
+    Paragraph text of a .docx file, parsed once per path and process
+    
+    word/document.xml is streamed straight out of the archive and each body
+    element is discarded once read, instead of building python-docx's full
+    document model. Like Document(path).paragraphs, only body paragraphs are
+    included (not those inside tables).
+    """
+    texts = []
+    depth = 0
+    with zipfile.ZipFile(path) as archive, archive.open('word/document.xml') as xml:
+        for event, element in ElementTree.iterparse(xml, events=('start', 'end')):
+            if event == 'start':
+                depth += 1
+                continue
+            depth -= 1
+            # <w:document> > <w:body> > paragraphs and tables
+            if depth == 2:
+                if element.tag == _W + 'p':
+                    texts.append(_paragraph_text(element))
+                element.clear()
+    return "\n".join(texts)
+
+
+def main():
+    # Construct an absolute path to the .docx file
+    doc_path = os.path.join(BASE_DIR, "Data", "Starry_Night.docx")
+    
+    # Read the document text straight from the .docx archive
+    document_text = load_doc(doc_path)
+    
+    # Now use your tool
+    tools = ArtAnalysisTools()
+    artwork_info = tools.extract_artwork_info(document_text)
+    period_from_text = tools._detect_periods_from_text(document_text)
+    fuzzy_color = tools._extract_colors_fuzzy(document_text)
+    historical_perspective = tools.parse_historical_perspectives(document_text)
+    
+    
+    print("=== TOOLS.PY OUTPUT ===")
+    print("ArtAnalysisTools.extract_artwork_info() results:")
+    _dump(artwork_info)
+    # print("ArtAnalysisTools._determine_periods_with_confidence() results:")
+    print("ArtAnalysisTools._detect_periods_from_text() results:")
+    _dump(period_from_text)
+    print("ArtAnalysisTools._extract_colors_fuzzy() results:")
+    _dump(fuzzy_color)
+    print("ArtAnalysisTools.parse_historical_perspectives() results:")
+    _dump(historical_perspective)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -1,13 +1,23 @@
-from typing import Dict, List, Any, Optional
-
-class PromptTemplates:
-    """
-    Enhanced prompt templates for Professor Helena with vision analysis support
-    """
-    
-    def get_visual_analysis_prompt(self) -> str:
-        """Prompt for initial visual analysis of artwork image"""
-        return """You are Professor Helena, an expert art historian with exceptional visual analysis skills. 
+import asyncio
+import functools
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+from itertools import islice
+from string import Formatter
+from typing import Dict, List, Any, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # stdlib fallback when orjson is not installed
+    orjson = None
+    import json
+
+# Static prompt text lives at module level; each prompt is HEADER + BODY + FOOTER,
+# where BODY holds the {slot} placeholders filled in per call. The enhanced
+# prompts are additionally preceded by _PERSONA_BLOCK
+_VISUAL_ANALYSIS_PROMPT = """You are Professor Helena, an expert art historian with exceptional visual analysis skills. 
         
 Analyze this artwork image with the methodical precision of a scholar. Provide a comprehensive visual analysis covering:
 
@@ -41,25 +51,28 @@ Analyze this artwork image with the methodical precision of a scholar. Provide a
 
 Provide specific, detailed observations rather than general statements. Focus on what you can directly observe in the image."""
 
-    def get_enhanced_analysis_prompt(self,
-                                   artwork_info: Dict[str, Any],
-                                   relevant_docs: List[str],
-                                   visual_elements: Optional[Dict[str, Any]] = None,
-                                   image_analysis: Optional[Dict[str, Any]] = None) -> str:
-        """Enhanced analysis prompt incorporating visual information"""
-        
-        base_prompt = f"""You are Professor Helena, a distinguished art historian known for your methodical, scholarly approach to art analysis. 
+# Opening shared by every enhanced prompt. For a given artwork it renders
+# byte-identically in the analysis, perspectives, synthesis and discussion
+# prompts, so Ollama can reuse the KV cache of this prefix between those calls
+# (automatic for prompts served by the same loaded model, no flag needed)
+_PERSONA_BLOCK = """You are Professor Helena, a distinguished art historian known for your methodical, scholarly approach to art analysis.
 
 **ARTWORK INFORMATION:**
-{self._format_artwork_info(artwork_info)}
+{artwork_info}
 
 **VISUAL ANALYSIS AVAILABLE:**
-{self._format_visual_elements(visual_elements) if visual_elements else "No visual analysis available"}
+{visual_elements}
 
-**RELEVANT HISTORICAL CONTEXT:**
-{self._format_relevant_docs(relevant_docs)}
+"""
 
-**YOUR TASK:**
+_NO_VISUAL_ANALYSIS = "No visual analysis available"
+
+_ENHANCED_ANALYSIS_BODY = """**RELEVANT HISTORICAL CONTEXT:**
+{relevant_docs}
+
+"""
+
+_ENHANCED_ANALYSIS_FOOTER = """**YOUR TASK:**
 Provide a comprehensive initial analysis that combines your expertise with the visual evidence. Your analysis should demonstrate:
 
 1. **Formal Analysis**: Technical examination of visual elements, composition, and execution
@@ -78,26 +91,16 @@ Provide a comprehensive initial analysis that combines your expertise with the v
 **FORMAT:**
 Structure your response as a scholarly analysis suitable for academic discourse, with clear reasoning and specific examples."""
 
-        return base_prompt
-
-    def get_enhanced_perspectives_prompt(self,
-                                       artwork_context: Dict[str, Any],
-                                       current_analysis: str,
-                                       visual_elements: Optional[Dict[str, Any]] = None) -> str:
-        """Enhanced historical perspectives prompt with visual context"""
-        
-        return f"""You are Professor Helena, conducting a multi-temporal analysis of this artwork.
+_PERSPECTIVES_HEADER = """You are now conducting a multi-temporal analysis of this artwork.
 
 **CURRENT ANALYSIS:**
-{current_analysis}
+"""
 
-**VISUAL ELEMENTS:**
-{self._format_visual_elements(visual_elements) if visual_elements else "Visual analysis not available"}
+_PERSPECTIVES_BODY = """{current_analysis}
 
-**ARTWORK CONTEXT:**
-{self._format_artwork_info(artwork_context)}
+"""
 
-**YOUR TASK:**
+_PERSPECTIVES_FOOTER = """**YOUR TASK:**
 Analyze how different historical periods would have interpreted this artwork. Consider how the visual elements you've observed would have been understood across time periods.
 
 **REQUIRED PERSPECTIVES:**
@@ -121,31 +124,19 @@ Analyze how different historical periods would have interpreted this artwork. Co
 
 Structure each perspective clearly, with specific examples from the visual analysis."""
 
-    def get_enhanced_synthesis_prompt(self,
-                                    artwork_context: Dict[str, Any],
-                                    current_analysis: str,
-                                    historical_perspectives: List[Dict[str, Any]],
-                                    visual_elements: Optional[Dict[str, Any]] = None,
-                                    image_analysis: Optional[Dict[str, Any]] = None) -> str:
-        """Enhanced synthesis prompt incorporating all visual and contextual information"""
-        
-        return f"""You are Professor Helena, preparing your final scholarly critique that synthesizes all analysis.
-
-**COMPREHENSIVE INFORMATION:**
-
-**Visual Analysis:**
-{self._format_visual_elements(visual_elements) if visual_elements else "No visual analysis"}
+_SYNTHESIS_HEADER = """You are now preparing your final scholarly critique that synthesizes all analysis.
 
 **Initial Analysis:**
-{current_analysis}
+"""
+
+_SYNTHESIS_BODY = """{current_analysis}
 
 **Historical Perspectives:**
-{self._format_historical_perspectives(historical_perspectives)}
+{historical_perspectives}
 
-**Artwork Context:**
-{self._format_artwork_info(artwork_context)}
+"""
 
-**YOUR FINAL CRITIQUE SHOULD:**
+_SYNTHESIS_FOOTER = """**YOUR FINAL CRITIQUE SHOULD:**
 
 1. **Synthesize Visual and Contextual Evidence**: Combine direct visual observations with historical knowledge
 2. **Present Scholarly Conclusions**: Offer well-reasoned interpretations supported by evidence
@@ -183,24 +174,58 @@ Structure each perspective clearly, with specific examples from the visual analy
 
 This should be a substantial, nuanced analysis that demonstrates deep engagement with both the visual evidence and the broader art historical context."""
 
-    def get_enhanced_discussion_prompt(self,
-                                     peer_message: str,
-                                     artwork_context: Dict[str, Any],
-                                     historical_perspectives: List[Dict[str, Any]],
-                                     visual_elements: Optional[Dict[str, Any]] = None) -> str:
-        """Enhanced discussion prompt for peer interaction"""
-        
-        return f"""You are Professor Helena, engaging in scholarly discussion with a peer about this artwork.
+_UNIFIED_CRITIQUE_BODY = """**RELEVANT HISTORICAL CONTEXT:**
+{relevant_docs}
+
+"""
+
+_UNIFIED_CRITIQUE_FOOTER = """**YOUR TASK:**
+Produce your complete critique in three consecutive sections. Each section builds on the previous ones, so write them in order.
+
+**SECTION 1 - INITIAL ANALYSIS** (enclose in <ANALYSIS></ANALYSIS>):
+1. **Formal Analysis**: Technical examination of visual elements, composition, and execution
+2. **Stylistic Identification**: Placement within art historical movements and traditions
+3. **Technical Assessment**: Materials, techniques, and craftsmanship evaluation
+4. **Cultural Context**: Social, religious, and historical circumstances
+5. **Comparative Analysis**: Relationships to other works and artists
+
+**SECTION 2 - HISTORICAL PERSPECTIVES** (enclose in <PERSPECTIVES></PERSPECTIVES>):
+Analyze how different historical periods would have interpreted this artwork. Give each perspective its own numbered heading:
+1. **Contemporary Reception** (Original period): How would this artwork have been understood when it was created?
+2. **Victorian Era** (19th century): How would 19th-century viewers have interpreted the visual elements and subject matter?
+3. **Modernist Period** (Early-Mid 20th century): How would modernist critics have analyzed the formal elements and composition?
+4. **Contemporary Analysis** (21st century): How do current art historical methods and cultural awareness inform our interpretation?
+
+**SECTION 3 - FINAL CRITIQUE** (enclose in <SYNTHESIS></SYNTHESIS>):
+Synthesize your analysis and the perspectives into a scholarly critique structured as:
+**I. Visual Foundation** - key formal elements and how they support your interpretation
+**II. Historical Contextualization** - the work's cultural and artistic moment
+**III. Interpretive Analysis** - meaning and significance across historical perspectives
+**IV. Contemporary Relevance** - the work's continued significance
+**V. Scholarly Assessment** - artistic achievement, historical importance, and open questions
+
+**APPROACH:**
+- Begin with direct visual observations
+- Support interpretations with specific evidence
+- Maintain scholarly objectivity while acknowledging aesthetic impact
+- Use precise art historical terminology appropriately
+
+**FORMAT:**
+Output exactly the three tagged sections, <ANALYSIS>...</ANALYSIS>, <PERSPECTIVES>...</PERSPECTIVES>, <SYNTHESIS>...</SYNTHESIS>, in that order. The SYNTHESIS section is your final critique and must read as a complete, substantial piece on its own."""
+
+_DISCUSSION_HEADER = """You are now engaging in scholarly discussion with a peer about this artwork.
 
 **PEER'S MESSAGE:**
-{peer_message}
+"""
+
+_DISCUSSION_BODY = """{peer_message}
 
 **YOUR ANALYSIS FOUNDATION:**
-Visual Elements: {self._format_visual_elements(visual_elements) if visual_elements else "Not available"}
-Artwork Context: {self._format_artwork_info(artwork_context)}
-Historical Perspectives: {self._format_historical_perspectives(historical_perspectives)}
+Historical Perspectives: {historical_perspectives}
+
+"""
 
-**DISCUSSION APPROACH:**
+_DISCUSSION_FOOTER = """**DISCUSSION APPROACH:**
 - Engage thoughtfully with your peer's observations
 - Offer additional insights from your visual analysis
 - Reference specific visual evidence when making points
@@ -217,24 +242,22 @@ Historical Perspectives: {self._format_historical_perspectives(historical_perspe
 
 Respond as a knowledgeable colleague who values both visual evidence and scholarly interpretation."""
 
-    def get_comparative_analysis_prompt(self,
-                                      artwork1_info: Dict[str, Any],
-                                      artwork2_info: Dict[str, Any],
-                                      visual_comparison: Dict[str, Any]) -> str:
-        """Prompt for comparing two artworks with visual analysis"""
-        
-        return f"""You are Professor Helena, conducting a comparative analysis of two artworks.
+_COMPARATIVE_HEADER = """You are Professor Helena, conducting a comparative analysis of two artworks.
 
 **ARTWORK 1:**
-{self._format_artwork_info(artwork1_info)}
+"""
+
+_COMPARATIVE_BODY = """{artwork1_info}
 
 **ARTWORK 2:**
-{self._format_artwork_info(artwork2_info)}
+{artwork2_info}
 
 **VISUAL COMPARISON:**
-{self._format_visual_comparison(visual_comparison)}
+{visual_comparison}
 
-**COMPARATIVE ANALYSIS FRAMEWORK:**
+"""
+
+_COMPARATIVE_FOOTER = """**COMPARATIVE ANALYSIS FRAMEWORK:**
 
 **I. Visual Relationships**
 - Compare formal elements (composition, color, line, form)
@@ -263,84 +286,398 @@ Respond as a knowledgeable colleague who values both visual evidence and scholar
 
 Use specific visual evidence to support all comparative observations."""
 
+
+
+def _compile_template(template: str) -> Tuple[List[str], List[str]]:
+    """
+    Split a {slot} template into its literal chunks and slot names
+    Done once, so rendering is a single join with no format parsing
+    """
+    literals, slots = [], []
+    for literal, slot, _, _ in Formatter().parse(template):
+        literals.append(literal)
+        if slot is not None:
+            slots.append(slot)
+    if len(literals) == len(slots):
+        literals.append("")
+    return literals, slots
+# Bound separators for the formatter helpers
+_NL = "\n".join
+_SC = "; ".join
+_CM = ", ".join
+
+# Rendered prompts kept when caching is enabled, oldest evicted first
+_PROMPT_CACHE_SIZE = 128
+
+# Title-cased visual element keys; the key set is small and fixed
+_TITLE_CACHE: Dict[str, str] = {}
+
+
+def _title(key: str) -> str:
+    """key.title(), computed once per distinct key"""
+    title = _TITLE_CACHE.get(key)
+    if title is None:
+        title = _TITLE_CACHE[key] = key.title()
+    return title
+
+
+def _key(obj: Any) -> bytes:
+    """Canonical JSON bytes for cache keying; dict keys are sorted at every level"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=str, sort_keys=True).encode()
+
+
+def _render_key(name: str, args: tuple, kwargs: Dict[str, Any]) -> bytes:
+    """Content hash of a prompt method's inputs"""
+    h = hashlib.blake2b(name.encode(), digest_size=16)
+    h.update(_key([args, kwargs]))
+    return h.digest()
+
+
+def _cached_prompt(method):
+    """Return a previously rendered prompt when the inputs hash the same (opt-in, LRU bounded)"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self._prompt_cache is None:
+            return method(self, *args, **kwargs)
+        
+        key = _render_key(method.__name__, args, kwargs)
+        with self._prompt_lock:
+            prompt = self._prompt_cache.get(key)
+            if prompt is not None:
+                self._prompt_cache.move_to_end(key)
+                return prompt
+        
+        prompt = method(self, *args, **kwargs)
+        with self._prompt_lock:
+            self._prompt_cache[key] = prompt
+            self._prompt_cache.move_to_end(key)
+            if len(self._prompt_cache) > _PROMPT_CACHE_SIZE:
+                self._prompt_cache.popitem(last=False)
+        return prompt
+    return wrapper
+
+
+class PromptTemplates:
+    """
+    Enhanced prompt templates for Professor Helena with vision analysis support
+    """
+    
+    __slots__ = (
+        '_prompt_cache',
+        '_prompt_lock',
+        '_value_formatters',
+        '_persona_template',
+        '_enhanced_analysis_template',
+        '_perspectives_template',
+        '_synthesis_template',
+        '_unified_critique_template',
+        '_discussion_template',
+        '_comparative_template'
+    )
+    
+    # Artwork info fields shown in prompts, in display order
+    _FIELDS = (
+        ('title', 'Title'),
+        ('artist', 'Artist'),
+        ('date', 'Date'),
+        ('medium', 'Medium'),
+        ('dimensions', 'Dimensions'),
+        ('location', 'Location'),
+        ('description', 'Description')
+    )
+    
+    def __init__(self, enable_cache: bool = False):
+        """
+        Args:
+            enable_cache: Reuse whole rendered prompts when a prompt method is
+                called again with equal inputs; the most recent _PROMPT_CACHE_SIZE
+                prompts are kept
+        """
+        self._prompt_cache = OrderedDict() if enable_cache else None
+        self._prompt_lock = threading.Lock()
+        
+        # Visual element values by exact type; one dict lookup instead of an isinstance chain
+        self._value_formatters = {
+            list: _CM,
+            dict: self._format_dict_values,
+            str: str,
+            int: str,
+            float: str
+        }
+        
+        # Compile every template once; get_*_prompt calls only fill the slots
+        self._persona_template = _compile_template(_PERSONA_BLOCK)
+        self._enhanced_analysis_template = _compile_template(_ENHANCED_ANALYSIS_BODY + _ENHANCED_ANALYSIS_FOOTER)
+        self._perspectives_template = _compile_template(_PERSPECTIVES_HEADER + _PERSPECTIVES_BODY + _PERSPECTIVES_FOOTER)
+        self._synthesis_template = _compile_template(_SYNTHESIS_HEADER + _SYNTHESIS_BODY + _SYNTHESIS_FOOTER)
+        self._unified_critique_template = _compile_template(_UNIFIED_CRITIQUE_BODY + _UNIFIED_CRITIQUE_FOOTER)
+        self._discussion_template = _compile_template(_DISCUSSION_HEADER + _DISCUSSION_BODY + _DISCUSSION_FOOTER)
+        self._comparative_template = _compile_template(_COMPARATIVE_HEADER + _COMPARATIVE_BODY + _COMPARATIVE_FOOTER)
+    
+    def clear_cache(self):
+        """Drop rendered prompts"""
+        if self._prompt_cache is not None:
+            with self._prompt_lock:
+                self._prompt_cache.clear()
+    
+    def get_visual_analysis_prompt(self) -> str:
+        """Prompt for initial visual analysis of artwork image"""
+        return _VISUAL_ANALYSIS_PROMPT
+
+    @_cached_prompt
+    def get_enhanced_analysis_prompt(self,
+                                   artwork_info: Dict[str, Any],
+                                   relevant_docs: List[str],
+                                   visual_elements: Optional[Dict[str, Any]] = None,
+                                   image_analysis: Optional[Dict[str, Any]] = None) -> str:
+        """Enhanced analysis prompt incorporating visual information"""
+        
+        return self._persona_block(artwork_info, visual_elements) + self._render(
+            self._enhanced_analysis_template,
+            relevant_docs=self._format_relevant_docs(relevant_docs)
+        )
+
+    @_cached_prompt
+    def get_enhanced_perspectives_prompt(self,
+                                       artwork_context: Dict[str, Any],
+                                       current_analysis: str,
+                                       visual_elements: Optional[Dict[str, Any]] = None) -> str:
+        """Enhanced historical perspectives prompt with visual context"""
+        
+        return self._persona_block(artwork_context, visual_elements) + self._render(
+            self._perspectives_template,
+            current_analysis=current_analysis
+        )
+
+    @_cached_prompt
+    def get_enhanced_synthesis_prompt(self,
+                                    artwork_context: Dict[str, Any],
+                                    current_analysis: str,
+                                    historical_perspectives: List[Dict[str, Any]],
+                                    visual_elements: Optional[Dict[str, Any]] = None,
+                                    image_analysis: Optional[Dict[str, Any]] = None) -> str:
+        """Enhanced synthesis prompt incorporating all visual and contextual information"""
+        
+        # The largest prompt: written piece by piece into one buffer rather than
+        # rendering the prefix and the tail separately and concatenating them
+        buf = io.StringIO()
+        self._write_template(
+            buf.write,
+            self._persona_template,
+            artwork_info=self._format_artwork_info(artwork_context),
+            visual_elements=self._format_persona_visuals(visual_elements)
+        )
+        self._write_template(
+            buf.write,
+            self._synthesis_template,
+            current_analysis=current_analysis,
+            historical_perspectives=self._format_historical_perspectives(historical_perspectives)
+        )
+        return buf.getvalue()
+
+    async def aget_enhanced_synthesis_prompt(self,
+                                             artwork_context: Dict[str, Any],
+                                             current_analysis: str,
+                                             historical_perspectives: List[Dict[str, Any]],
+                                             visual_elements: Optional[Dict[str, Any]] = None,
+                                             image_analysis: Optional[Dict[str, Any]] = None) -> str:
+        """get_enhanced_synthesis_prompt with the independent formatters run concurrently in worker threads"""
+        artwork_text, visual_text, perspectives_text = await self._aformat(
+            (self._format_artwork_info, artwork_context),
+            (self._format_persona_visuals, visual_elements),
+            (self._format_historical_perspectives, historical_perspectives)
+        )
+        buf = io.StringIO()
+        self._write_template(buf.write, self._persona_template,
+                             artwork_info=artwork_text, visual_elements=visual_text)
+        self._write_template(buf.write, self._synthesis_template,
+                             current_analysis=current_analysis,
+                             historical_perspectives=perspectives_text)
+        return buf.getvalue()
+
+    @_cached_prompt
+    def get_unified_critique_prompt(self,
+                                    artwork_info: Dict[str, Any],
+                                    relevant_docs: List[str],
+                                    visual_elements: Optional[Dict[str, Any]] = None,
+                                    image_analysis: Optional[Dict[str, Any]] = None) -> str:
+        """Single prompt producing analysis, historical perspectives and synthesis as tagged sections"""
+
+        buf = io.StringIO()
+        self._write_template(
+            buf.write,
+            self._persona_template,
+            artwork_info=self._format_artwork_info(artwork_info),
+            visual_elements=self._format_persona_visuals(visual_elements)
+        )
+        self._write_template(
+            buf.write,
+            self._unified_critique_template,
+            relevant_docs=self._format_relevant_docs(relevant_docs)
+        )
+        return buf.getvalue()
+
+    async def aget_unified_critique_prompt(self,
+                                           artwork_info: Dict[str, Any],
+                                           relevant_docs: List[str],
+                                           visual_elements: Optional[Dict[str, Any]] = None,
+                                           image_analysis: Optional[Dict[str, Any]] = None) -> str:
+        """get_unified_critique_prompt with the independent formatters run concurrently in worker threads"""
+        artwork_text, visual_text, docs_text = await self._aformat(
+            (self._format_artwork_info, artwork_info),
+            (self._format_persona_visuals, visual_elements),
+            (self._format_relevant_docs, relevant_docs)
+        )
+        buf = io.StringIO()
+        self._write_template(buf.write, self._persona_template,
+                             artwork_info=artwork_text, visual_elements=visual_text)
+        self._write_template(buf.write, self._unified_critique_template,
+                             relevant_docs=docs_text)
+        return buf.getvalue()
+
+    @_cached_prompt
+    def get_enhanced_discussion_prompt(self,
+                                     peer_message: str,
+                                     artwork_context: Dict[str, Any],
+                                     historical_perspectives: List[Dict[str, Any]],
+                                     visual_elements: Optional[Dict[str, Any]] = None) -> str:
+        """Enhanced discussion prompt for peer interaction"""
+        
+        return self._persona_block(artwork_context, visual_elements) + self._render(
+            self._discussion_template,
+            peer_message=peer_message,
+            historical_perspectives=self._format_historical_perspectives(historical_perspectives)
+        )
+
+    @_cached_prompt
+    def get_comparative_analysis_prompt(self,
+                                      artwork1_info: Dict[str, Any],
+                                      artwork2_info: Dict[str, Any],
+                                      visual_comparison: Dict[str, Any]) -> str:
+        """Prompt for comparing two artworks with visual analysis"""
+        
+        return self._render(
+            self._comparative_template,
+            artwork1_info=self._format_artwork_info(artwork1_info),
+            artwork2_info=self._format_artwork_info(artwork2_info),
+            visual_comparison=self._format_visual_comparison(visual_comparison)
+        )
+
+    def _persona_block(self,
+                       artwork_context: Dict[str, Any],
+                       visual_elements: Optional[Dict[str, Any]] = None) -> str:
+        """Shared persona, artwork and visual prefix that opens every enhanced prompt"""
+        return self._render(
+            self._persona_template,
+            artwork_info=self._format_artwork_info(artwork_context),
+            visual_elements=self._format_persona_visuals(visual_elements)
+        )
+
+    def _format_persona_visuals(self, visual_elements: Optional[Dict[str, Any]]) -> str:
+        """Visual elements as shown in the persona block, with its fallback text"""
+        return self._format_visual_elements(visual_elements) if visual_elements else _NO_VISUAL_ANALYSIS
+
+    async def _aformat(self, *calls) -> List[str]:
+        """Run (formatter, value) pairs concurrently in worker threads"""
+        return await asyncio.gather(
+            *(asyncio.to_thread(formatter, value) for formatter, value in calls)
+        )
+
+    @staticmethod
+    def _render(template: Tuple[List[str], List[str]], **values: str) -> str:
+        """Interleave a compiled template's literal chunks with the slot values"""
+        literals, slots = template
+        parts = [literals[0]]
+        for slot, literal in zip(slots, literals[1:]):
+            parts.append(values[slot])
+            parts.append(literal)
+        return "".join(parts)
+
+    @staticmethod
+    def _write_template(write, template: Tuple[List[str], List[str]], **values: str):
+        """Stream a compiled template's literal chunks and slot values into write()"""
+        literals, slots = template
+        write(literals[0])
+        for slot, literal in zip(slots, literals[1:]):
+            write(values[slot])
+            write(literal)
+
     # Helper methods for formatting
     def _format_artwork_info(self, artwork_info: Dict[str, Any]) -> str:
         """Format artwork information for prompts"""
         if not artwork_info:
             return "No specific artwork information provided"
         
-        formatted = []
-        
-        if artwork_info.get('title'):
-            formatted.append(f"Title: {artwork_info['title']}")
-        if artwork_info.get('artist'):
-            formatted.append(f"Artist: {artwork_info['artist']}")
-        if artwork_info.get('date'):
-            formatted.append(f"Date: {artwork_info['date']}")
-        if artwork_info.get('medium'):
-            formatted.append(f"Medium: {artwork_info['medium']}")
-        if artwork_info.get('dimensions'):
-            formatted.append(f"Dimensions: {artwork_info['dimensions']}")
-        if artwork_info.get('location'):
-            formatted.append(f"Location: {artwork_info['location']}")
-        if artwork_info.get('description'):
-            formatted.append(f"Description: {artwork_info['description']}")
+        get = artwork_info.get
+        formatted = [f"{label}: {value}" for key, label in self._FIELDS if (value := get(key))]
         
-        return '\n'.join(formatted) if formatted else "Basic artwork information available"
+        return _NL(formatted) if formatted else "Basic artwork information available"
 
     def _format_visual_elements(self, visual_elements: Dict[str, Any]) -> str:
         """Format visual elements for prompts"""
         if not visual_elements:
             return "No visual elements analyzed"
         
-        formatted = []
-        
-        for key, value in visual_elements.items():
-            if value:
-                if isinstance(value, list):
-                    formatted.append(f"**{key.title()}**: {', '.join(value)}")
-                elif isinstance(value, dict):
-                    formatted.append(f"**{key.title()}**: {self._format_dict_values(value)}")
-                else:
-                    formatted.append(f"**{key.title()}**: {value}")
+        formatted = _NL(
+            f"**{_title(key)}**: {self._format_value(value)}"
+            for key, value in visual_elements.items()
+            if value
+        )
         
-        return '\n'.join(formatted) if formatted else "Visual elements not available"
+        return formatted or "Visual elements not available"
 
-    def _format_dict_values(self, d: Dict[str, Any]) -> str:
+    def _format_value(self, value: Any) -> str:
+        """Render one visual element value: lists comma-separated, dicts as key: value pairs"""
+        formatter = self._value_formatters.get(type(value))
+        if formatter is not None:
+            return formatter(value)
+        
+        # Subclasses of list/dict miss the exact-type table
+        if isinstance(value, list):
+            return _CM(value)
+        if isinstance(value, dict):
+            return self._format_dict_values(value)
+        return str(value)
+
+    @staticmethod
+    def _format_dict_values(d: Dict[str, Any]) -> str:
         """Format dictionary values for display"""
-        items = []
-        for k, v in d.items():
-            if isinstance(v, list):
-                items.append(f"{k}: {', '.join(v)}")
-            else:
-                items.append(f"{k}: {v}")
-        return '; '.join(items)
+        return _SC(
+            f"{k}: {_CM(v) if isinstance(v, list) else v}"
+            for k, v in d.items()
+        )
 
     def _format_relevant_docs(self, docs: List[str]) -> str:
         """Format relevant documents for prompts"""
         if not docs:
             return "No relevant historical documents found"
-        formatted = []
-        for i, doc in enumerate(docs[:3], 1):  # Limit to top 3 for brevity
-            if isinstance(doc, dict) and "content" in doc:
-                content = doc["content"]
-            else:
-                content = str(doc)
-            formatted.append(f"{i}. {content[:200]}...")
-        return '\n'.join(formatted)
+        return _NL(
+            f"{i}. {self._doc_excerpt(doc)}..."
+            for i, doc in enumerate(islice(docs, 3), 1)  # Limit to top 3 for brevity
+        )
+
+    @staticmethod
+    def _doc_excerpt(doc: Any, limit: int = 200) -> str:
+        """Leading slice of a document, taken before any str() conversion"""
+        if isinstance(doc, dict) and "content" in doc:
+            # Slice the raw field; a large dict is never stringified whole
+            return doc["content"][:limit]
+        if isinstance(doc, str):
+            return doc[:limit]
+        return str(doc)[:limit]
 
     def _format_historical_perspectives(self, perspectives: List[Dict[str, Any]]) -> str:
         """Format historical perspectives for prompts"""
         if not perspectives:
             return "No historical perspectives available"
         
-        formatted = []
-        for perspective in perspectives:
-            period = perspective.get('period', 'Unknown Period')
-            analysis = perspective.get('analysis', 'No analysis available')
-            formatted.append(f"**{period}**: {analysis[:300]}...")
-        
-        return '\n'.join(formatted)
+        return _NL(
+            f"**{perspective.get('period', 'Unknown Period')}**: "
+            f"{perspective.get('analysis', 'No analysis available')[:300]}..."
+            for perspective in perspectives
+        )
 
     def _format_visual_comparison(self, comparison: Dict[str, Any]) -> str:
         """Format visual comparison for prompts"""
@@ -350,12 +687,16 @@ Use specific visual evidence to support all comparative observations."""
         formatted = []
         
         if comparison.get('similarities'):
-            formatted.append(f"**Similarities**: {'; '.join(comparison['similarities'])}")
+            formatted.append(f"**Similarities**: {_SC(comparison['similarities'])}")
         
         if comparison.get('differences'):
-            formatted.append(f"**Differences**: {'; '.join(comparison['differences'])}")
+            formatted.append(f"**Differences**: {_SC(comparison['differences'])}")
         
         if comparison.get('style_relationship'):
             formatted.append(f"**Style Relationship**: {comparison['style_relationship']}")
         
-        return '\n'.join(formatted) if formatted else "Visual comparison not available"
\ No newline at end of file
+        return _NL(formatted) if formatted else "Visual comparison not available"
+
+
+# Shared instance; prompt builders hold only caches and compiled templates
+templates = PromptTemplates()
\ No newline at end of file
@@ -1,27 +1,102 @@
-from docx import Document
+import asyncio
+import base64
+import hashlib
 import os
+import shelve
 
-# Extract text from .docx
-doc_path = os.path.join('Data', 'Starry_Night.docx')
-doc = Document(doc_path)
-text = '\n'.join([p.text for p in doc.paragraphs])
+text_model = "llama3.1:8b"
+vision_model = "llava:13b"
+cache_path = '.helena_cache'
+text_cache_dir = '.helena_cache_text'
 
-img_path = os.path.join('Data', 'Starry_Night.jpg')
+# Modules whose changes alter the critique; their sources are part of the cache key
+pipeline_sources = ('main.py', 'prompt_templates.py', 'tools.py', 'vision_tools.py', 'memory.py')
 
-# Run analysis
-from main import ProfessorHelena
-import asyncio
 
-helena = ProfessorHelena(
-    text_model="llama3.1:8b",
-    vision_model="llava:13b"
-)
+def load_description(doc_path):
+    """Extract text from .docx; the cached plain text is reused while the .docx size and mtime are unchanged"""
+    st = os.stat(doc_path)
+    stamp = f'{st.st_size}:{st.st_mtime_ns}\n'
+    text_cache_path = os.path.join(text_cache_dir, os.path.splitext(os.path.basename(doc_path))[0] + '.txt')
+    if os.path.exists(text_cache_path):
+        with open(text_cache_path, encoding='utf-8') as f:
+            if f.readline() == stamp:
+                return f.read()
+
+    # python-docx (and lxml) is only imported when the text has to be re-extracted
+    from docx import Document
+    doc = Document(doc_path)
+    text = '\n'.join(p.text for p in doc.paragraphs)
+    os.makedirs(text_cache_dir, exist_ok=True)
+    with open(text_cache_path, 'w', encoding='utf-8') as f:
+        f.write(stamp)
+        f.write(text)
+    return text
+
+
+def pipeline_version():
+    """Hash of the pipeline sources, so editing a prompt or stage invalidates cached critiques"""
+    h = hashlib.sha256()
+    src_dir = os.path.dirname(os.path.abspath(__file__))
+    for name in pipeline_sources:
+        with open(os.path.join(src_dir, name), 'rb') as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def critique_cache_key(text, image_bytes, version):
+    """Critiques are cached by the exact image bytes, description, models and pipeline version"""
+    return ':'.join((
+        hashlib.sha256(image_bytes).hexdigest(),
+        hashlib.sha256(text.encode('utf-8')).hexdigest(),
+        text_model,
+        vision_model,
+        version
+    ))
+
+
+async def main():
+    doc_path = os.path.join('Data', 'Starry_Night.docx')
+    img_path = os.path.join('Data', 'Starry_Night.jpg')
+
+    # The image is read once; its bytes feed both the cache key and the model input
+    with open(img_path, 'rb') as f:
+        image_bytes = f.read()
+
+    # One (description, image bytes) pair per artwork; all uncached ones run concurrently
+    jobs = [(load_description(doc_path), image_bytes)]
+    version = pipeline_version()
+    keys = [critique_cache_key(text, image, version) for text, image in jobs]
+
+    # Re-running on the same artwork skips the model calls entirely
+    with shelve.open(cache_path) as cache:
+        critiques = [cache.get(key) for key in keys]
+    pending = [i for i, critique in enumerate(critiques) if critique is None]
+
+    # Run analysis; the agent stack is only imported on a cache miss
+    if pending:
+        from main import ProfessorHelena
+
+        helena = ProfessorHelena(
+            text_model=text_model,
+            vision_model=vision_model
+        )
+
+        results = await asyncio.gather(*(
+            helena.analyze_artwork_with_image(
+                artwork_description=jobs[i][0],
+                image_data=base64.b64encode(jobs[i][1]).decode('ascii')
+            )
+            for i in pending
+        ))
+
+        with shelve.open(cache_path) as cache:
+            for i, critique in zip(pending, results):
+                critiques[i] = cache[keys[i]] = critique
+
+    for critique in critiques:
+        print(critique)
 
-critique = asyncio.run(
-    helena.analyze_artwork_with_image(
-        artwork_description=text,
-        image_path=img_path
-    )
-)
 
-print(critique)
\ No newline at end of file
+if __name__ == "__main__":
+    asyncio.run(main())
\ No newline at end of file
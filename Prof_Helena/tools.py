@@ -1,5 +1,218 @@
+import copy
+import functools
 import re
-from typing import Dict, Any, List
+import string
+from dataclasses import dataclass
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from itertools import islice
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+try:
+    import re2
+except ImportError:  # google-re2 is optional; the stdlib engine handles every pattern
+    re2 = None
+
+# Patterns are compiled once at import time rather than on every call
+
+# Title: quoted text or "titled"/"called"/"painting" followed by a quoted name
+_TITLE_RES = [re.compile(p, re.IGNORECASE) for p in (
+    r'"([^"]+)"',
+    r"titled\s+['\"]([^'\"]+)['\"]",
+    r"called\s+['\"]([^'\"]+)['\"]",
+    r"painting\s+['\"]([^'\"]+)['\"]"
+)]
+
+# Artist name, with specific lead-ins to avoid false positives. All lead-ins
+# share one name subpattern; the lookahead reports overlapping candidates and
+# the named lead-in groups are listed in priority order
+_ARTIST_TRIGGERS = ("by", "artist", "work", "master")
+_ARTIST_RE = re.compile(
+    r"(?=(?:(?P<by>(?:painted|created|made|drawn|sculpted|designed)\s+by)|(?P<artist>artist)"
+    r"|(?P<work>work\s+(?:of|by))|(?P<master>master|painter))"
+    r"\s+(?P<name>[A-Z][a-z]+(?:\s+(?:van|de|da|del|du|le|la|von|di)\s+)?[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*))",
+    re.IGNORECASE
+)
+_PLACE_PREFIX_RE = re.compile(r'^(?:New|North|South|East|West|Saint|San|Santa)\s+', re.IGNORECASE)
+
+_YEAR_RE = re.compile(r"\b(1[4-9]\d{2}|20[0-2]\d)\b")
+# Every year _YEAR_RE can produce
+_YEAR_RANGE = range(1400, 2030)
+
+# Section boundaries for various formats, as one pattern with a named group
+# per format; the formats are listed in the order they are preferred
+_SECTION_FORMATS = ("numbered", "bold", "markdown", "colon", "bullet", "dash", "dot")
+_SECTION_BOUNDARY_RE = re.compile(
+    r'\n(?='
+    r'(?P<numbered>\d+\.\s)'  # Numbered lists: "1. ", "2. "
+    r'|(?P<bold>\*\*[^*]+\*\*)'  # Bold headers: **Header**
+    r'|(?P<markdown>#{1,3}\s)'  # Markdown headers: # ## ###
+    r'|(?P<colon>[A-Z][^:]*:)'  # Colon headers: "Period Name:"
+    r'|(?P<bullet>\*\s)'  # Bullet points: "* "
+    r'|(?P<dash>-\s)'  # Dash points: "- "
+    r'|(?P<dot>•\s)'  # Bullet points: "• "
+    r')'
+)
+
+# Enhanced period detection with more patterns. Each pattern is paired with
+# lowercase literals of which at least one must occur for it to match, so
+# most patterns are skipped by a substring test (None: always run)
+_PERIOD_RES = [(literals, p and re.compile(p, re.IGNORECASE | re.MULTILINE)) for p, literals in (
+    (r'(?:^|\n|\*\*|##)\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s*(?:Era|Period|Century|Perspective|View|Analysis|Interpretation)',
+     ("era", "period", "century", "perspective", "view", "analysis", "interpretation")),
+    (None, None),  # Period names, see _period_name_re
+    (r'(\d{2}th|\d{1}st|\d{2}nd|\d{2}rd)\s+[Cc]entury', ("century",)),
+    (r'(Early|Mid|Late)\s+(Renaissance|Baroque|Medieval|Modern|Contemporary)', ("early", "mid", "late")),
+    (r'(Pre-|Post-)?([A-Z][a-z]+(?:ist|ism|al))', ("ist", "ism", "al"))
+)]
+
+# Period words recognised in perspectives besides the known period names
+_OTHER_PERIOD_WORDS = ("gothic", "classical", "victorian", "enlightenment")
+
+
+@functools.lru_cache(maxsize=8)
+def _period_name_re(known_periods: Tuple[str, ...]) -> re.Pattern:
+    """Case-insensitive literal union of the known period names and other period words, longest first"""
+    names = sorted(set(known_periods).union(_OTHER_PERIOD_WORDS), key=len, reverse=True)
+    return re.compile('|'.join(re.escape(name) for name in names), re.IGNORECASE)
+
+# Key aspects with more flexible patterns, prefiltered the same way
+_ASPECT_RES = [(literals, re.compile(p, re.IGNORECASE)) for p, literals in (
+    (r'[-•*]\s*([^\n]+)', ("-", "•", "*")),  # Bullet points
+    (r'\d+\.\s*([^\n]+)', (".",)),  # Numbered lists
+    (r'(?:Key|Important|Notable|Significant)\s+(?:aspects?|points?|elements?):\s*([^\n]+)',
+     ("key", "important", "notable", "significant")),
+    (r'(?:They would|This period|Scholars)\s+(?:emphasize|focus on|highlight|note)\s+([^.]+)',
+     ("they would", "this period", "scholars"))
+)]
+
+# Non-empty runs of text between sentence terminators
+_SENTENCE_RE = re.compile(r'[^.!?]+')
+
+def _first_match(patterns: List[re.Pattern], text: str) -> Optional[re.Match]:
+    """Match of the first pattern (in list order) that matches anywhere in the text"""
+    return next(filter(None, (pattern.search(text) for pattern in patterns)), None)
+
+def _compile_dfa(pattern: str):
+    """
+    Compile a lookahead-free keyword union with RE2 when google-re2 is installed
+    
+    RE2 matches in linear time without backtracking. Note that its \\b is
+    ASCII-only, so a keyword touching a non-ASCII letter can match under RE2.
+    """
+    if re2 is not None:
+        return re2.compile(pattern)
+    return re.compile(pattern)
+
+# Words in lowercased text; hyphenated compounds are kept whole
+_TOKEN_RE = re.compile(r"[a-z]+(?:-[a-z]+)*")
+
+# Runs of word characters; a single-word term matches \bterm\b exactly
+# when it is one of these runs
+_WORD_RE = re.compile(r"\w+")
+
+# Punctuation (ASCII plus common typographic marks) mapped to spaces, so that
+# splitting leaves bare words
+_PUNCT_TO_SPACE = str.maketrans({c: ' ' for c in string.punctuation + '“”‘’–—…•'})
+
+
+def _tokenize(text_lower: str) -> set:
+    """Set of words in the text; hyphenated compounds also contribute their parts"""
+    tokens = set(_TOKEN_RE.findall(text_lower))
+    tokens.update(part for token in tuple(tokens) if '-' in token for part in token.split('-'))
+    return tokens
+
+def _word_set(text_lower: str) -> frozenset:
+    """Set of word-character runs in the text"""
+    return frozenset(_WORD_RE.findall(text_lower))
+
+def _index_synonyms(synonyms: Dict[str, List[str]]) -> Tuple[Tuple[str, ...], Dict[str, Tuple[int, ...]]]:
+    """
+    Number the base terms and map each base term and synonym to the ids it
+    stands for (a synonym such as "amber" can belong to more than one base)
+    
+    Returns:
+        The base terms in definition order (indexed by id) and the term -> ids map
+    """
+    bases = tuple(synonyms)
+    term_ids = {}
+    for base_id, (base, terms) in enumerate(synonyms.items()):
+        for term in [base] + terms:
+            term_ids.setdefault(term, ())
+            if base_id not in term_ids[term]:
+                term_ids[term] += (base_id,)
+    return bases, term_ids
+
+def _compile_phrases(terms, word_re: re.Pattern):
+    """
+    Word-bounded union of the terms that are not a single token under word_re
+    
+    Single-token terms are looked up in a token set instead; returns None
+    when every term is a single token.
+    """
+    phrases = [term for term in terms if not word_re.fullmatch(term)]
+    if not phrases:
+        return None
+    alternation = '|'.join(re.escape(term) for term in sorted(phrases, key=len, reverse=True))
+    return _compile_dfa(r'\b(?:' + alternation + r')\b')
+
+def _index_keywords(categories: Dict[str, List[str]]) -> Tuple[Dict[str, Tuple[str, ...]], Dict[str, Tuple[str, ...]]]:
+    """
+    Index plain keywords across several categories for word-prefix lookup
+    
+    Returns:
+        Single-word keywords and multi-word phrases (punctuation normalised to
+        spaces, e.g. "three-dimensional" -> "three dimensional"), each mapped to
+        (keyword, category...) with the keyword in its original spelling
+    """
+    words, phrases = {}, {}
+    for category, keywords in categories.items():
+        for keyword in keywords:
+            normalised = ' '.join(keyword.translate(_PUNCT_TO_SPACE).split())
+            index = phrases if ' ' in normalised else words
+            index[normalised] = index.get(normalised, (keyword,)) + (category,)
+    return words, phrases
+
+@dataclass(frozen=True, slots=True)
+class ArtworkInfo:
+    """
+    Immutable artwork information, as cached by ArtAnalysisTools
+    
+    extract_artwork_info returns the to_dict() form, which is what the
+    prompts and memory consume.
+    """
+    description: str
+    title: Optional[str] = None
+    artist: Optional[str] = None
+    period: Optional[str] = None
+    year: Optional[int] = None
+    medium: Optional[str] = None
+    style: Optional[str] = None
+    subjects: Tuple[str, ...] = ()
+    techniques: Tuple[str, ...] = ()
+    colors: Tuple[str, ...] = ()
+    emotions: Tuple[str, ...] = ()
+    # Period candidates as (key, value) pairs; None when no year or period name was found
+    periods: Optional[Tuple[Tuple[Tuple[str, Any], ...], ...]] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict with list fields (a "periods" entry only when candidates exist)"""
+        info = {
+            "description": self.description,
+            "title": self.title,
+            "artist": self.artist,
+            "period": self.period,
+            "year": self.year,
+            "medium": self.medium,
+            "style": self.style,
+            "subjects": list(self.subjects),
+            "techniques": list(self.techniques),
+            "colors": list(self.colors),
+            "emotions": list(self.emotions)
+        }
+        if self.periods is not None:
+            info["periods"] = [dict(candidate) for candidate in self.periods]
+        return info
 
 class ArtAnalysisTools:
     """
@@ -95,6 +308,61 @@ class ArtAnalysisTools:
             "gray": ["silver", "ash", "slate", "pewter", "charcoal"]
         }
         
+        # Keyword lists for medium, style and formal element detection
+        self.mediums = ["oil", "watercolor", "acrylic", "tempera", "fresco", "canvas", "panel", "sculpture", "bronze", "marble"]
+        self.styles = ["renaissance", "baroque", "impressionist", "cubist", "abstract", "realistic", "surreal", "expressionist"]
+        self.element_terms = {
+            "composition": ["balanced", "symmetrical", "asymmetrical", "diagonal", "triangular", "circular", "vertical", "horizontal"],
+            "color": ["warm", "cool", "saturated", "muted", "bright", "dark", "monochromatic", "complementary"],
+            "line": ["curved", "straight", "flowing", "rigid", "dynamic", "static", "bold", "delicate"],
+            "form": ["three-dimensional", "flat", "sculptural", "geometric", "organic", "angular", "rounded"],
+            "light": ["chiaroscuro", "dramatic", "soft", "harsh", "natural", "artificial", "backlighting", "spotlight"]
+        }
+        
+        # Colors and emotions are looked up by word; multi-word terms, if
+        # any are added, go through a phrase pattern
+        self._color_bases, self._color_ids = _index_synonyms(self.color_synonyms)
+        self._color_phrase_re = _compile_phrases(self._color_ids, _WORD_RE)
+        self._emotion_bases, self._emotion_ids = _index_synonyms(self.emotion_synonyms)
+        self._emotion_phrase_re = _compile_phrases(self._emotion_ids, _WORD_RE)
+        # Period names and styles are looked up by word; multi-word styles
+        # such as "plein air" get a separate phrase pattern
+        self._period_bases, self._period_ids = _index_synonyms(
+            {period: info["styles"] for period, info in self.art_periods.items()}
+        )
+        self._period_phrase_re = _compile_phrases(self._period_ids, _TOKEN_RE)
+        
+        self._keyword_words, self._keyword_phrases = _index_keywords(
+            {"medium": self.mediums, "style": self.styles, **self.element_terms}
+        )
+        
+        # Confidence zones as parallel arrays (one entry per zone, in period
+        # then declaration order), with centre, half-width and label precomputed
+        zones = [
+            (period_index, zone_start, zone_end)
+            for period_index, info in enumerate(self.art_periods.values())
+            for zone_start, zone_end in info["confidence_zones"]
+        ]
+        self._period_names = tuple(self.art_periods)
+        self._zone_periods = tuple(period_index for period_index, _, _ in zones)
+        self._zone_ends = tuple(zone_end for _, _, zone_end in zones)
+        self._zone_centers = tuple((zone_start + zone_end) / 2 for _, zone_start, zone_end in zones)
+        self._zone_half_widths = tuple((zone_end - zone_start) / 2 for _, zone_start, zone_end in zones)
+        self._zone_labels = tuple(f"{zone_start}-{zone_end}" for _, zone_start, zone_end in zones)
+        # Zone ids by start year, so a bisect finds every zone starting at or before a year
+        self._zones_by_start = tuple(sorted(range(len(zones)), key=lambda zone_id: zones[zone_id][1]))
+        self._sorted_zone_starts = tuple(zones[zone_id][1] for zone_id in self._zones_by_start)
+        
+        # Period confidences for every extractable year are computed once up front
+        self._year_table = dict(zip(_YEAR_RANGE, self._score_years(_YEAR_RANGE)))
+        
+        # Parsing is a pure function of the input text, so repeated texts are
+        # served from a per-instance cache (callers get a deep copy)
+        self._extract_artwork_info_cached = functools.lru_cache(maxsize=512)(self._extract_artwork_info)
+        self._parse_historical_perspectives_cached = functools.lru_cache(maxsize=512)(
+            self._parse_historical_perspectives
+        )
+        
     def extract_artwork_info(self, description: str) -> Dict[str, Any]:
         """
         Extract key information from artwork description
@@ -111,91 +379,79 @@ class ArtAnalysisTools:
                 description = " ".join([doc.page_content for doc in description])
             else:
                 description = " ".join(map(str, description))
-        artwork_info = {
-            "description": description,
-            "title": None,
-            "artist": None,
-            "period": None,
-            "year": None,
-            "medium": None,
-            "style": None,
-            "subjects": [],
-            "techniques": [],
-            "colors": [],
-            "emotions": []
-        }
+        # The cached result is immutable; each caller gets a fresh dict
+        return self._extract_artwork_info_cached(description).to_dict()
+    
+    def _extract_artwork_info(self, description: str) -> ArtworkInfo:
+        """Uncached extraction for a single description string"""
+        title = period = year = periods = None
         
         # Extract title (look for quoted text or "titled" patterns)
-        title_patterns = [
-            r'"([^"]+)"',
-            r"titled\s+['\"]([^'\"]+)['\"]",
-            r"called\s+['\"]([^'\"]+)['\"]",
-            r"painting\s+['\"]([^'\"]+)['\"]"
-        ]
-        
-        for pattern in title_patterns:
-            match = re.search(pattern, description, re.IGNORECASE)
-            if match:
-                artwork_info["title"] = match.group(1)
-                break
-        
-        # Extract artist name with more specific patterns to avoid false positives
-        artist_patterns = [
-            r"(?:painted|created|made|drawn|sculpted|designed)\s+by\s+([A-Z][a-z]+(?:\s+(?:van|de|da|del|du|le|la|von|di)\s+)?[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)",
-            r"artist\s+([A-Z][a-z]+(?:\s+(?:van|de|da|del|du|le|la|von|di)\s+)?[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)",
-            r"work\s+(?:of|by)\s+([A-Z][a-z]+(?:\s+(?:van|de|da|del|du|le|la|von|di)\s+)?[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)",
-            r"(?:master|painter)\s+([A-Z][a-z]+(?:\s+(?:van|de|da|del|du|le|la|von|di)\s+)?[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)"
-        ]
-        
-        for pattern in artist_patterns:
-            match = re.search(pattern, description, re.IGNORECASE)
-            if match:
-                # Additional validation to avoid place names
-                candidate = match.group(1).strip()
-                # Exclude common place name patterns
-                if not re.match(r'^(?:New|North|South|East|West|Saint|San|Santa)\s+', candidate, re.IGNORECASE):
-                    artwork_info["artist"] = candidate
-                    break
+        match = _first_match(_TITLE_RES, description)
+        if match:
+            title = match.group(1)
         
         # Extract year/period with multiple candidate support
-        year_matches = re.findall(r"\b(1[4-9]\d{2}|20[0-2]\d)\b", description)
+        year_matches = _YEAR_RE.findall(description)
         if year_matches:
             # Take the first reasonable year found
-            artwork_info["year"] = int(year_matches[0])
-            artwork_info["periods"] = self._determine_periods_with_confidence(artwork_info["year"])
+            year = int(year_matches[0])
+            periods = self._determine_periods_with_confidence(year)
             # Set primary period as the one with highest confidence
-            if artwork_info["periods"]:
-                artwork_info["period"] = artwork_info["periods"][0]["period"]
+            if periods:
+                period = periods[0]["period"]
         
-        # Also check for period names directly mentioned
-        detected_periods = self._detect_periods_from_text(description)
-        if detected_periods and not artwork_info.get("period"):
-            artwork_info["period"] = detected_periods[0]
-            artwork_info["periods"] = [{"period": p, "confidence": 0.8} for p in detected_periods]
-        
-        # Extract medium
-        mediums = ["oil", "watercolor", "acrylic", "tempera", "fresco", "canvas", "panel", "sculpture", "bronze", "marble"]
-        for medium in mediums:
-            if medium in description.lower():
-                artwork_info["medium"] = medium
-                break
+        # The keyword helpers below all share one lowercased copy of the text
+        text_lower = description.lower()
         
-        # Extract style/movement
-        styles = ["renaissance", "baroque", "impressionist", "cubist", "abstract", "realistic", "surreal", "expressionist"]
-        for style in styles:
-            if style in description.lower():
-                artwork_info["style"] = style
-                break
-        
-        # Extract colors with fuzzy matching and synonyms
-        found_colors = self._extract_colors_fuzzy(description)
-        artwork_info["colors"] = found_colors
+        # Also check for period names directly mentioned
+        detected_periods = self._detect_periods_from_text(description, text_lower)
+        if detected_periods and not period:
+            period = detected_periods[0]
+            periods = [{"period": p, "confidence": 0.8} for p in detected_periods]
+        
+        # Mediums and styles are found in one keyword scan; list order decides ties
+        keywords = self._find_keywords(text_lower)
+        # Colors and emotions probe the same words
+        words = _word_set(text_lower)
+        
+        return ArtworkInfo(
+            description=description,
+            title=title,
+            # Extract artist name with more specific patterns to avoid false positives
+            artist=self._extract_artist(description),
+            period=period,
+            year=year,
+            medium=next((medium for medium in self.mediums if medium in keywords["medium"]), None),
+            style=next((style for style in self.styles if style in keywords["style"]), None),
+            # Colors and emotional content with fuzzy matching and synonyms
+            colors=tuple(self._extract_colors_fuzzy(description, text_lower, words)),
+            emotions=tuple(self._extract_emotions_fuzzy(description, text_lower, words)),
+            periods=None if periods is None else tuple(tuple(candidate.items()) for candidate in periods)
+        )
+    
+    def _extract_artist(self, description: str) -> Optional[str]:
+        """
+        Find the artist name following a lead-in such as "painted by" or "artist"
         
-        # Extract emotional content with fuzzy matching
-        found_emotions = self._extract_emotions_fuzzy(description)
-        artwork_info["emotions"] = found_emotions
+        Lead-ins are tried in priority order, each at its first occurrence,
+        and a candidate that looks like a place name is skipped.
+        """
+        # First candidate for each lead-in, from a single scan
+        candidates = {}
+        for match in _ARTIST_RE.finditer(description):
+            for trigger in _ARTIST_TRIGGERS:
+                if match.group(trigger) is not None:
+                    candidates.setdefault(trigger, match.group("name"))
+                    break
         
-        return artwork_info
+        for trigger in _ARTIST_TRIGGERS:
+            if trigger in candidates:
+                candidate = candidates[trigger].strip()
+                # Exclude common place name patterns
+                if not _PLACE_PREFIX_RE.match(candidate):
+                    return candidate
+        return None
     
     def _determine_periods_with_confidence(self, year: int) -> List[Dict[str, Any]]:
         """
@@ -207,82 +463,137 @@ class ArtAnalysisTools:
         Returns:
             List of periods with confidence scores, sorted by confidence
         """
-        candidates = []
-        
-        for period, info in self.art_periods.items():
-            # Check if year falls within any confidence zone
-            for zone_start, zone_end in info["confidence_zones"]:
-                if zone_start <= year <= zone_end:
-                    # Calculate confidence based on position within zone
-                    zone_center = (zone_start + zone_end) / 2
-                    zone_width = zone_end - zone_start
-                    distance_from_center = abs(year - zone_center)
-                    confidence = max(0.5, 1.0 - (distance_from_center / (zone_width / 2)) * 0.5)
-                    
-                    candidates.append({
-                        "period": period,
-                        "confidence": confidence,
-                        "zone": f"{zone_start}-{zone_end}"
-                    })
-                    break
+        candidates = self._year_table.get(year)
+        if candidates is None:
+            return self._score_years((year,))[0]
+        # Copy so callers cannot modify the shared table
+        return [dict(candidate) for candidate in candidates]
+    
+    def classify_years(self, years: Iterable[int]) -> List[List[Dict[str, Any]]]:
+        """
+        Determine period candidates for a batch of years
         
-        # Sort by confidence (highest first)
-        candidates.sort(key=lambda x: x["confidence"], reverse=True)
-        return candidates
+        Args:
+            years: Years of the artworks
+            
+        Returns:
+            One list of periods with confidence scores per year, in input order
+        """
+        years = list(years)
+        # Years outside the precomputed table are scored together in one pass
+        missing = [year for year in years if year not in self._year_table]
+        scored = dict(zip(missing, self._score_years(missing)))
+        scored.update((year, self._year_table[year]) for year in years if year not in scored)
+        
+        # Copy so callers cannot modify the shared table
+        return [[dict(candidate) for candidate in scored[year]] for year in years]
     
-    def _detect_periods_from_text(self, text: str) -> List[str]:
-        """Detect period names directly mentioned in text"""
-        detected = []
-        text_lower = text.lower()
-        
-        for period, info in self.art_periods.items():
-            # Check period name
-            if period in text_lower:
-                detected.append(period)
+    def _score_years(self, years: Iterable[int]) -> List[List[Dict[str, Any]]]:
+        """Score every confidence zone containing each year (backs the precomputed year table)"""
+        results = []
+        
+        for year in years:
+            # First containing zone per period, in declaration order
+            period_zones = {}
+            for i in range(bisect_right(self._sorted_zone_starts, year)):
+                zone_id = self._zones_by_start[i]
+                if year <= self._zone_ends[zone_id]:
+                    period_index = self._zone_periods[zone_id]
+                    if zone_id < period_zones.get(period_index, zone_id + 1):
+                        period_zones[period_index] = zone_id
             
-            # Check associated styles
-            for style in info["styles"]:
-                if style in text_lower:
-                    detected.append(period)
-                    break
+            candidates = []
+            for period_index, zone_id in sorted(period_zones.items()):
+                # Calculate confidence based on position within zone
+                distance_from_center = abs(year - self._zone_centers[zone_id])
+                confidence = max(0.5, 1.0 - (distance_from_center / self._zone_half_widths[zone_id]) * 0.5)
+                candidates.append({
+                    "period": self._period_names[period_index],
+                    "confidence": confidence,
+                    "zone": self._zone_labels[zone_id]
+                })
+            
+            # Sort by confidence (highest first)
+            candidates.sort(key=lambda x: x["confidence"], reverse=True)
+            results.append(candidates)
         
-        return list(set(detected))  # Remove duplicates
+        return results
     
-    def _extract_colors_fuzzy(self, text: str) -> List[str]:
-        """Extract colors using fuzzy matching with synonyms"""
-        found_colors = []
-        text_lower = text.lower()
-        
-        for base_color, synonyms in self.color_synonyms.items():
-            # Check base color
-            if re.search(r'\b' + base_color + r'\b', text_lower):
-                found_colors.append(base_color)
-            else:
-                # Check synonyms
-                for synonym in synonyms:
-                    if re.search(r'\b' + synonym + r'\b', text_lower):
-                        found_colors.append(base_color)
-                        break
-        
-        return list(set(found_colors))  # Remove duplicates
+    def _detect_periods_from_text(self, text: str, text_lower: Optional[str] = None) -> List[str]:
+        """Detect period names directly mentioned in text (text_lower: the text already lowercased, if at hand)"""
+        if text_lower is None:
+            text_lower = text.lower()
+        
+        # Period names and single-word styles are matched as whole words
+        return self._lookup_terms(
+            _tokenize(text_lower), text_lower, self._period_bases, self._period_ids, self._period_phrase_re
+        )
     
-    def _extract_emotions_fuzzy(self, text: str) -> List[str]:
-        """Extract emotions using fuzzy matching with synonyms"""
-        found_emotions = []
-        text_lower = text.lower()
-        
-        for base_emotion, synonyms in self.emotion_synonyms.items():
-            # Check base emotion
-            if re.search(r'\b' + base_emotion + r'\b', text_lower):
-                found_emotions.append(base_emotion)
-            else:
-                # Check synonyms
-                for synonym in synonyms:
-                    if re.search(r'\b' + synonym + r'\b', text_lower):
-                        found_emotions.append(base_emotion)
-                        break
+    def _extract_colors_fuzzy(self, text: str, text_lower: Optional[str] = None,
+                              words: Optional[frozenset] = None) -> List[str]:
+        """Extract colors using fuzzy matching with synonyms (text_lower/words: the lowercased text and its word set, if at hand)"""
+        if text_lower is None:
+            text_lower = text.lower()
+        if words is None:
+            words = _word_set(text_lower)
+        
+        # Each matched term maps back to its base color(s)
+        return self._lookup_terms(
+            words, text_lower, self._color_bases, self._color_ids, self._color_phrase_re
+        )
+    
+    def _extract_emotions_fuzzy(self, text: str, text_lower: Optional[str] = None,
+                                words: Optional[frozenset] = None) -> List[str]:
+        """Extract emotions using fuzzy matching with synonyms (text_lower/words: the lowercased text and its word set, if at hand)"""
+        if text_lower is None:
+            text_lower = text.lower()
+        if words is None:
+            words = _word_set(text_lower)
+        
+        # Each matched term maps back to its base emotion(s)
+        return self._lookup_terms(
+            words, text_lower, self._emotion_bases, self._emotion_ids, self._emotion_phrase_re
+        )
+    
+    @staticmethod
+    def _lookup_terms(tokens, text_lower: str, bases: Tuple[str, ...], term_ids: Dict[str, Tuple[int, ...]],
+                      phrase_re) -> List[str]:
+        """
+        Base terms for every indexed term present: single words via the token set,
+        phrases via phrase_re. Each base is reported once, in definition order.
+        """
+        ids = set()
+        for term in term_ids.keys() & tokens:
+            ids.update(term_ids[term])
+        if phrase_re is not None:
+            for match in phrase_re.finditer(text_lower):
+                ids.update(term_ids[match.group()])
+        return [bases[base_id] for base_id in sorted(ids)]
+    
+    def _find_keywords(self, text_lower: str) -> Dict[str, set]:
+        """
+        Collect the medium/style/element keywords in the lowercased text, by category
         
-        return list(set(found_emotions))  # Remove duplicates
+        A keyword counts when it starts a word ("dark" in "darkness", but not
+        "oil" in "soil"), found by bisecting the sorted distinct words.
+        """
+        words = text_lower.translate(_PUNCT_TO_SPACE).split()
+        vocabulary = sorted(set(words))
+        found = defaultdict(set)
+        
+        for word, (keyword, *categories) in self._keyword_words.items():
+            i = bisect_left(vocabulary, word)
+            if i < len(vocabulary) and vocabulary[i].startswith(word):
+                for category in categories:
+                    found[category].add(keyword)
+        
+        if self._keyword_phrases:
+            normalised = ' ' + ' '.join(words)
+            for phrase, (keyword, *categories) in self._keyword_phrases.items():
+                if ' ' + phrase in normalised:
+                    for category in categories:
+                        found[category].add(keyword)
+        return found
     
     def parse_historical_perspectives(self, perspectives_text: str) -> List[Dict[str, Any]]:
         """
@@ -294,31 +605,35 @@ class ArtAnalysisTools:
         Returns:
             List of structured perspective objects
         """
+        # Known period names are part of the key so edits to art_periods are honoured
+        return copy.deepcopy(
+            self._parse_historical_perspectives_cached(perspectives_text, tuple(self.art_periods))
+        )
+    
+    def _parse_historical_perspectives(self, perspectives_text: str, known_periods: Tuple[str, ...]) -> List[Dict[str, Any]]:
+        """Uncached parsing for a single perspectives text"""
         perspectives = []
+        known_period_set = frozenset(known_periods)
         
-        # Enhanced splitting patterns for various formats
-        splitting_patterns = [
-            r'\n(?=\d+\.\s)',  # Numbered lists: "1. ", "2. "
-            r'\n(?=\*\*[^*]+\*\*)',  # Bold headers: **Header**
-            r'\n(?=#{1,3}\s)',  # Markdown headers: # ## ###
-            r'\n(?=[A-Z][^:]*:)',  # Colon headers: "Period Name:"
-            r'\n(?=\*\s)',  # Bullet points: "* "
-            r'\n(?=-\s)',  # Dash points: "- "
-            r'\n(?=•\s)'   # Bullet points: "• "
-        ]
-        
-        # Try different splitting approaches
+        # Split on the first format (in preference order) that yields more
+        # than one non-empty section; boundaries come from a single scan
         sections = [perspectives_text]  # Start with full text
         
-        for pattern in splitting_patterns:
-            new_sections = []
-            for section in sections:
-                split_result = re.split(pattern, section)
-                if len(split_result) > 1:
-                    new_sections.extend([s.strip() for s in split_result if s.strip()])
-                else:
-                    new_sections.append(section)
-            if len(new_sections) > len(sections):
+        boundaries = defaultdict(list)
+        for match in _SECTION_BOUNDARY_RE.finditer(perspectives_text):
+            boundaries[match.lastgroup].append(match.start())
+        
+        for section_format in _SECTION_FORMATS:
+            if section_format not in boundaries:
+                continue
+            starts = [0] + [offset + 1 for offset in boundaries[section_format]]
+            ends = boundaries[section_format] + [len(perspectives_text)]
+            new_sections = [
+                perspectives_text[start:end].strip()
+                for start, end in zip(starts, ends)
+                if perspectives_text[start:end].strip()
+            ]
+            if len(new_sections) > 1:
                 sections = new_sections
                 break
         
@@ -334,56 +649,61 @@ class ArtAnalysisTools:
                 "confidence": 0.7
             }
             
-            # Enhanced period detection with more patterns
-            period_patterns = [
-                r'(?:^|\n|\*\*|##)\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s*(?:Era|Period|Century|Perspective|View|Analysis|Interpretation)',
-                r'(?:Renaissance|Baroque|Medieval|Ancient|Modern|Contemporary|Impressionist|Romantic|Neoclassical|Gothic|Classical|Victorian|Enlightenment)',
-                r'(\d{2}th|\d{1}st|\d{2}nd|\d{2}rd)\s+[Cc]entury',
-                r'(Early|Mid|Late)\s+(Renaissance|Baroque|Medieval|Modern|Contemporary)',
-                r'(Pre-|Post-)?([A-Z][a-z]+(?:ist|ism|al))'
-            ]
+            section_lower = section.lower()
             
-            for pattern in period_patterns:
-                match = re.search(pattern, section, re.IGNORECASE | re.MULTILINE)
+            # Enhanced period detection with more patterns
+            for literals, pattern in _PERIOD_RES:
+                if literals and not any(literal in section_lower for literal in literals):
+                    continue
+                if pattern is None:
+                    # A known period name identifies the period directly
+                    match = _period_name_re(known_periods).search(section)
+                    if match and match.group().lower() in known_periods:
+                        perspective["period"] = match.group().lower().title()
+                        perspective["confidence"] = 0.9
+                        break
+                else:
+                    match = pattern.search(section)
                 if match:
                     if len(match.groups()) == 1:
-                        period_candidate = match.group(1).title()
+                        period_candidate = match.group(1)
                     else:
-                        # Handle multi-group matches
-                        period_candidate = ' '.join([g for g in match.groups() if g]).title()
+                        # Handle multi-group matches (or none: use the whole match)
+                        period_candidate = ' '.join([g for g in match.groups() if g]) or match.group()
                     
-                    # Validate against known periods
+                    # Validate against known periods, comparing in lowercase; an exact
+                    # name wins, otherwise the first known period (in order) overlapping it
                     period_lower = period_candidate.lower()
-                    for known_period in self.art_periods.keys():
-                        if known_period in period_lower or period_lower in known_period:
-                            perspective["period"] = known_period.title()
-                            perspective["confidence"] = 0.9
-                            break
+                    if period_lower in known_period_set:
+                        perspective["period"] = period_lower.title()
+                        perspective["confidence"] = 0.9
+                    else:
+                        for known_period in known_periods:
+                            if known_period in period_lower or period_lower in known_period:
+                                perspective["period"] = known_period.title()
+                                perspective["confidence"] = 0.9
+                                break
                     
                     if perspective["period"] == "Unknown":
-                        perspective["period"] = period_candidate
+                        perspective["period"] = period_candidate.title()
                         perspective["confidence"] = 0.6
                     break
             
             # Extract key aspects with more flexible patterns
-            aspect_patterns = [
-                r'[-•*]\s*([^\n]+)',  # Bullet points
-                r'\d+\.\s*([^\n]+)',  # Numbered lists
-                r'(?:Key|Important|Notable|Significant)\s+(?:aspects?|points?|elements?):\s*([^\n]+)',
-                r'(?:They would|This period|Scholars)\s+(?:emphasize|focus on|highlight|note)\s+([^.]+)'
-            ]
-            
-            for pattern in aspect_patterns:
-                matches = re.findall(pattern, section, re.IGNORECASE)
+            for literals, pattern in _ASPECT_RES:
+                if not any(literal in section_lower for literal in literals):
+                    continue
+                matches = pattern.findall(section)
                 if matches:
                     perspective["key_aspects"].extend(matches[:3])  # Limit to top 3
                     break
             
             # If no aspects found, extract from main text
             if not perspective["key_aspects"]:
-                sentences = re.split(r'[.!?]+', section)
-                key_sentences = [s.strip() for s in sentences if 20 < len(s.strip()) < 150][:2]
-                perspective["key_aspects"] = key_sentences
+                # Lazily split and stop after the first two usable sentences
+                sentences = (match.group().strip() for match in _SENTENCE_RE.finditer(section))
+                key_sentences = islice((s for s in sentences if 20 < len(s) < 150), 2)
+                perspective["key_aspects"] = list(key_sentences)
             
             perspectives.append(perspective)
         
@@ -408,24 +728,9 @@ class ArtAnalysisTools:
             "space": []
         }
         
-        # Composition terms
-        comp_terms = ["balanced", "symmetrical", "asymmetrical", "diagonal", "triangular", "circular", "vertical", "horizontal"]
-        elements["composition"] = [term for term in comp_terms if term in description.lower()]
-        
-        # Color terms
-        color_terms = ["warm", "cool", "saturated", "muted", "bright", "dark", "monochromatic", "complementary"]
-        elements["color"] = [term for term in color_terms if term in description.lower()]
-        
-        # Line terms
-        line_terms = ["curved", "straight", "flowing", "rigid", "dynamic", "static", "bold", "delicate"]
-        elements["line"] = [term for term in line_terms if term in description.lower()]
-        
-        # Form terms
-        form_terms = ["three-dimensional", "flat", "sculptural", "geometric", "organic", "angular", "rounded"]
-        elements["form"] = [term for term in form_terms if term in description.lower()]
-        
-        # Light terms
-        light_terms = ["chiaroscuro", "dramatic", "soft", "harsh", "natural", "artificial", "backlighting", "spotlight"]
-        elements["light"] = [term for term in light_terms if term in description.lower()]
+        # All element terms are found in one keyword scan
+        keywords = self._find_keywords(description.lower())
+        for category, terms in self.element_terms.items():
+            elements[category] = [term for term in terms if term in keywords[category]]
         
         return elements
\ No newline at end of file
@@ -1,11 +1,262 @@
+import functools
 import re
+from bisect import bisect_left
+from collections import defaultdict
+from dataclasses import dataclass
+from itertools import chain
 from typing import Dict, List, Any, Optional, Tuple
+
+try:
+    import re2
+except ImportError:  # google-re2 is optional; the stdlib engine handles every pattern
+    re2 = None
+
+# Keywords of each category, matched as lowercase substrings. A keyword can
+# belong to several categories ('chiaroscuro' is a technique and lighting)
+_CATEGORY_KEYWORDS = {
+    'composition': (
+        'composition', 'arrangement', 'layout', 'structure',
+        'triangular', 'circular', 'linear', 'diagonal', 'symmetrical', 'asymmetrical',
+        'centered', 'off-center', 'rule of thirds', 'golden ratio'
+    ),
+    'style': (
+        # Historical periods
+        'renaissance', 'baroque', 'rococo', 'neoclassical', 'romantic', 'realist',
+        'impressionist', 'post-impressionist', 'expressionist', 'cubist', 'surrealist',
+        'abstract', 'modern', 'contemporary', 'medieval', 'gothic', 'byzantine',
+        
+        # Specific styles
+        'realistic', 'abstract', 'figurative', 'geometric', 'organic',
+        'minimalist', 'maximalist', 'decorative', 'ornate', 'simple',
+        'classical', 'traditional', 'avant-garde', 'experimental'
+    ),
+    'medium': (
+        'oil painting', 'oil on canvas', 'acrylic', 'watercolor', 'tempera',
+        'fresco', 'pastel', 'charcoal', 'pencil', 'ink', 'gouache',
+        'canvas', 'wood', 'panel', 'paper', 'silk', 'metal',
+        'sculpture', 'bronze', 'marble', 'stone', 'clay', 'ceramic',
+        'photograph', 'print', 'etching', 'lithograph', 'woodcut',
+        'mixed media', 'collage', 'assemblage'
+    ),
+    'technique': (
+        'brushwork', 'brushstrokes', 'impasto', 'glazing', 'scumbling',
+        'alla prima', 'wet-on-wet', 'dry brush', 'stippling', 'cross-hatching',
+        'blending', 'layering', 'underpainting', 'overpainting',
+        'chiaroscuro', 'sfumato', 'tenebrism', 'pointillism'
+    ),
+    'subject_matter': (
+        'portrait', 'landscape', 'still life', 'figure', 'nude', 'religious',
+        'mythological', 'historical', 'genre scene', 'interior', 'exterior',
+        'animal', 'flower', 'tree', 'building', 'architecture',
+        'person', 'woman', 'man', 'child', 'group', 'crowd'
+    ),
+    'line': ('line', 'linear', 'contour', 'outline', 'curved', 'straight', 'diagonal'),
+    'shape': ('shape', 'circular', 'rectangular', 'triangular', 'organic', 'geometric'),
+    'form': ('form', 'volume', 'mass', 'three-dimensional', '3d', 'dimensional'),
+    'space': ('space', 'spatial', 'depth', 'foreground', 'background', 'middle ground'),
+    'lighting': (
+        'lighting', 'light', 'shadow', 'bright', 'dark', 'illuminated',
+        'dramatic lighting', 'soft light', 'harsh light', 'natural light',
+        'artificial light', 'backlighting', 'side lighting', 'front lighting',
+        'chiaroscuro', 'tenebrism', 'luminous', 'glowing', 'radiant'
+    ),
+    'perspective': (
+        'perspective', 'linear perspective', 'atmospheric perspective',
+        'one-point perspective', 'two-point perspective', 'three-point perspective',
+        'bird\'s eye view', 'worm\'s eye view', 'eye level', 'high angle', 'low angle',
+        'vanishing point', 'horizon line', 'foreshortening'
+    ),
+    'texture': (
+        'texture', 'textured', 'smooth', 'rough', 'coarse', 'fine',
+        'grainy', 'silky', 'glossy', 'matte', 'bumpy', 'ridged',
+        'fabric', 'skin', 'hair', 'fur', 'metal', 'wood grain'
+    ),
+    'mood': (
+        'mood', 'emotion', 'feeling', 'atmosphere', 'ambiance',
+        'serene', 'peaceful', 'calm', 'tranquil', 'dramatic', 'intense',
+        'melancholic', 'joyful', 'somber', 'mysterious', 'energetic',
+        'contemplative', 'spiritual', 'romantic', 'nostalgic', 'powerful'
+    ),
+    
+    # Technical details
+    'support': ('canvas', 'wood', 'panel', 'paper', 'board', 'copper', 'silk'),
+    'condition': ('restored', 'damaged', 'pristine', 'aged', 'cracked', 'faded', 'well-preserved')
+}
+
+# Formal elements, in the order they are reported
+_FORMAL_ELEMENTS = ('line', 'shape', 'form', 'space')
+
+
+def _index_categories(category_keywords: Dict[str, Tuple[str, ...]]) -> Dict[str, Tuple[str, ...]]:
+    """Map each keyword to the categories it belongs to, in category order"""
+    index = defaultdict(list)
+    for category, keywords in category_keywords.items():
+        for keyword in keywords:
+            if category not in index[keyword]:
+                index[keyword].append(category)
+    return {keyword: tuple(categories) for keyword, categories in index.items()}
+
+_KEYWORD_CATEGORIES = _index_categories(_CATEGORY_KEYWORDS)
+
+
+def _trie_pattern(words) -> str:
+    """
+    Regex source matching the longest of the given words, factored by shared
+    prefixes so that an offset where no word starts fails on one character
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+    
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in node.items() if char]
+        if not branches:
+            return ''
+        pattern = branches[0] if len(branches) == 1 else '(?:%s)' % '|'.join(branches)
+        if '' in node:
+            # The longer continuations are tried first, then the word ending here
+            pattern = '(?:%s)?' % pattern
+        return pattern
+    
+    return build(trie)
+
+# All keywords as one pattern, tried at every offset of the lowercased text.
+# The lookahead reports the longest keyword starting there; the shorter ones
+# starting at the same offset are its keyword prefixes ('light' for 'lighting')
+_KEYWORD_RE = re.compile('(?=(%s))' % _trie_pattern(_KEYWORD_CATEGORIES))
+
+def _index_hits(keyword_categories: Dict[str, Tuple[str, ...]]) -> Dict[str, Tuple[Tuple[str, str], ...]]:
+    """
+    Map the longest keyword at an offset to the (category, keyword) hits it
+    stands for, so each match costs one dict lookup
+    
+    Within a category the longest keyword starting at the offset wins, so
+    'woodcut' is not also a 'wood' medium and 'realistic' not a 'realist' style.
+    """
+    index = {}
+    for keyword in keyword_categories:
+        longest = {}
+        # Prefixes are visited shortest first, so longer ones overwrite
+        for prefix in sorted((k for k in keyword_categories if keyword.startswith(k)), key=len):
+            for category in keyword_categories[prefix]:
+                longest[category] = prefix
+        index[keyword] = tuple(longest.items())
+    return index
+
+_KEYWORD_HITS = _index_hits(_KEYWORD_CATEGORIES)
+
+
+# Position of each keyword in its category's list, for categories where the
+# earliest-listed keyword present wins (a repeated keyword keeps its first position)
+_KEYWORD_RANKS = {
+    category: {keyword: rank for rank, keyword in reversed(tuple(enumerate(keywords)))}
+    for category, keywords in _CATEGORY_KEYWORDS.items()
+}
+
+def _earliest_listed(category: str, found: Dict[str, int]) -> str:
+    """The found keyword that comes first in the category's keyword list"""
+    return min(found, key=_KEYWORD_RANKS[category].__getitem__)
+
+@functools.lru_cache(maxsize=256)
+def _word_set(text_lower: str) -> frozenset:
+    """Set of whitespace-separated words (cached, as one artwork is compared against many)"""
+    return frozenset(text_lower.split())
+
+def _dot_offsets(text: str) -> List[int]:
+    """Offsets of the '.' characters that separate sentences"""
+    offsets = []
+    offset = text.find('.')
+    while offset != -1:
+        offsets.append(offset)
+        offset = text.find('.', offset + 1)
+    return offsets
+
+
+@dataclass(frozen=True, slots=True)
+class _ParseCtx:
+    """A visual analysis lowercased, split at its dots and keyword-scanned once for all extractors"""
+    text: str
+    text_lower: str
+    dots: List[int]  # Offsets of the sentence-separating dots in text
+    hits: Dict[str, Dict[str, int]]  # category -> {keyword: sentence index}, in order of occurrence
+    
+    def sentence(self, index: int) -> str:
+        """The index-th '.'-separated sentence, stripped, sliced out of the text"""
+        dots = self.dots
+        start = dots[index - 1] + 1 if index else 0
+        end = dots[index] if index < len(dots) else len(self.text)
+        return self.text[start:end].strip()
+
+
+# Color descriptions as one pattern: a modifier or "shades of" before the
+# color word, or a color word before "colored"/"palette". Only the text up to
+# the color word is consumed, so descriptions can chain ("rich deep red")
+_COLOR_RE = re.compile(
+    r'(?:predominantly|rich|deep|vibrant|muted|warm|cool)\s+(?=(\w+))'
+    r'|(?:shades?|tones?|hues?)\s+of\s+(?=(\w+))'
+    r'|(\w+)(?=\s+(?:colored?|hued?|toned?|palette))'
+)
+
+# Words the color descriptions pick up that are not colors
+_NON_COLORS = frozenset({'light', 'dark', 'bright', 'pale', 'deep', 'rich', 'vibrant', 'muted', 'warm', 'cool'})
+
+def _compile_dfa(pattern: str):
+    """
+    Compile a lookaround-free pattern with RE2 when google-re2 is installed
+    
+    RE2 matches in linear time without backtracking. Note that its \\s is
+    ASCII-only, so a non-breaking space no longer separates words under RE2.
+    """
+    if re2 is not None:
+        return re2.compile(pattern)
+    return re.compile(pattern)
+
+# Brushwork descriptions and named brushwork techniques
+_BRUSHWORK_RES = [_compile_dfa(p) for p in (
+    r'brush(?:work|stroke)s?\s+(?:are|is)?\s*([^.]+)',
+    r'(?:thick|thin|bold|delicate|loose|tight)\s+(?:brush|stroke)s?',
+    r'impasto|glazing|scumbling|alla prima'
+)]
+
+# Size references
+_SIZE_RES = [_compile_dfa(p) for p in (
+    r'(?:large|small|medium|huge|tiny|massive|miniature)\s+(?:scale|size|work|painting)',
+    r'(?:monumental|intimate|grand|modest)\s+(?:scale|proportions?)'
+)]
+
+# Color groups for temperature, intensity and scheme assessment
+_WARM_COLORS = frozenset({'red', 'orange', 'yellow', 'brown', 'gold'})
+_COOL_COLORS = frozenset({'blue', 'green', 'purple', 'silver'})
+_HIGH_INTENSITY_COLORS = frozenset({'red', 'blue', 'yellow', 'orange', 'purple', 'green'})
+_LOW_INTENSITY_COLORS = frozenset({'brown', 'gray', 'grey', 'beige', 'cream'})
+_COMPLEMENTARY_PAIRS = (
+    frozenset({'red', 'green'}), frozenset({'blue', 'orange'}), frozenset({'yellow', 'purple'})
+)
+_ANALOGOUS_GROUPS = (
+    frozenset({'red', 'orange', 'yellow'}),
+    frozenset({'blue', 'green', 'purple'}),
+    frozenset({'yellow', 'green', 'blue'})
+)
+_TRIADIC_SETS = (
+    frozenset({'red', 'blue', 'yellow'}),
+    frozenset({'orange', 'green', 'purple'})
+)
+
+
 class VisionAnalysisTools:
     """
     Tools for analyzing visual elements in artwork images
     Works with open-source vision models to extract structured information
     """
     
+    __slots__ = (
+        'color_names',
+        '_parse_context_cached'
+    )
+    
     def __init__(self):
         self.color_names = {
             # Basic colors
@@ -21,6 +272,10 @@ class VisionAnalysisTools:
             'gold': [(255, 215, 0), (218, 165, 32), (184, 134, 11)],
             'silver': [(192, 192, 192), (169, 169, 169), (211, 211, 211)]
         }
+        
+        # parse_visual_elements and extract_technical_details start from the same
+        # context, so a text given to both is lowercased and scanned once
+        self._parse_context_cached = functools.lru_cache(maxsize=32)(self._parse_context)
     
     def parse_visual_elements(self, visual_analysis: str) -> Dict[str, Any]:
         """
@@ -32,228 +287,135 @@ class VisionAnalysisTools:
         Returns:
             Structured dictionary of visual elements
         """
+        ctx = self._parse_context_cached(visual_analysis)
+        
         elements = {
-            'composition': self._extract_composition(visual_analysis),
-            'color_palette': self._extract_colors(visual_analysis),
-            'style': self._extract_style(visual_analysis),
-            'medium': self._extract_medium(visual_analysis),
-            'technique': self._extract_technique(visual_analysis),
-            'subject_matter': self._extract_subject_matter(visual_analysis),
-            'formal_elements': self._extract_formal_elements(visual_analysis),
-            'lighting': self._extract_lighting(visual_analysis),
-            'perspective': self._extract_perspective(visual_analysis),
-            'texture': self._extract_texture(visual_analysis),
-            'mood': self._extract_mood(visual_analysis)
+            'composition': self._extract_composition(ctx),
+            'color_palette': self._extract_colors(ctx),
+            'style': self._extract_style(ctx),
+            'medium': self._extract_medium(ctx),
+            'technique': self._extract_technique(ctx),
+            'subject_matter': self._extract_subject_matter(ctx),
+            'formal_elements': self._extract_formal_elements(ctx),
+            'lighting': self._extract_lighting(ctx),
+            'perspective': self._extract_perspective(ctx),
+            'texture': self._extract_texture(ctx),
+            'mood': self._extract_mood(ctx)
         }
         
         return {k: v for k, v in elements.items() if v}  # Remove empty values
     
-    def _extract_composition(self, text: str) -> Optional[str]:
-        """Extract composition information"""
-        composition_keywords = [
-            'composition', 'arrangement', 'layout', 'structure',
-            'triangular', 'circular', 'linear', 'diagonal', 'symmetrical', 'asymmetrical',
-            'centered', 'off-center', 'rule of thirds', 'golden ratio'
-        ]
+    def _parse_context(self, text: str) -> _ParseCtx:
+        """Lowercase the text, find its sentence boundaries and scan it for keywords, once for every extractor"""
+        text_lower = text.lower()
+        dots = _dot_offsets(text)
+        # Lowercasing never shortens text, so unless it lengthened it (as
+        # 'İ' does) the boundaries are at the same offsets in both
+        lower_dots = dots if len(text_lower) == len(text) else _dot_offsets(text_lower)
+        return _ParseCtx(text, text_lower, dots, self._scan_keywords(text_lower, lower_dots))
+    
+    def _scan_keywords(self, text_lower: str, dots: List[int]) -> Dict[str, Dict[str, int]]:
+        """
+        Find the keywords of every category in one pass over the lowercased text
         
-        sentences = text.split('.')
-        for sentence in sentences:
-            if any(keyword in sentence.lower() for keyword in composition_keywords):
-                return sentence.strip()
+        Args:
+            text_lower: The lowercased text
+            dots: Offsets of the sentence-separating dots in text_lower
         
-        return None
+        Returns:
+            category -> {keyword: index of the first sentence containing it},
+            with keywords in order of first occurrence
+        """
+        hits = defaultdict(dict)
+        for match in _KEYWORD_RE.finditer(text_lower):
+            # A hit's sentence is the number of dots before it (no keyword contains a dot)
+            sentence = bisect_left(dots, match.start())
+            for category, keyword in _KEYWORD_HITS[match.group(1)]:
+                hits[category].setdefault(keyword, sentence)
+        return hits
+    
+    def _extract_composition(self, ctx: _ParseCtx) -> Optional[str]:
+        """Extract composition information"""
+        return self._find_info_by_keywords(ctx, ctx.hits['composition'])
     
-    def _extract_colors(self, text: str) -> List[str]:
+    def _extract_colors(self, ctx: _ParseCtx) -> List[str]:
         """Extract color information"""
-        colors_found = []
-        text_lower = text.lower()
-        
-        # Look for direct color mentions
-        for color_name in self.color_names.keys():
-            if color_name in text_lower:
-                colors_found.append(color_name)
-        
-        # Look for color descriptions
-        color_patterns = [
-            r'(\w+)\s+(?:colored?|hued?|toned?)',
-            r'(?:shades?|tones?|hues?)\s+of\s+(\w+)',
-            r'(\w+)\s+palette',
-            r'predominantly\s+(\w+)',
-            r'rich\s+(\w+)',
-            r'deep\s+(\w+)',
-            r'vibrant\s+(\w+)',
-            r'muted\s+(\w+)',
-            r'warm\s+(\w+)',
-            r'cool\s+(\w+)'
-        ]
-        
-        for pattern in color_patterns:
-            matches = re.findall(pattern, text_lower)
-            colors_found.extend(matches)
-        
-        # Remove duplicates and common non-colors
-        colors_found = list(set(colors_found))
-        non_colors = ['light', 'dark', 'bright', 'pale', 'deep', 'rich', 'vibrant', 'muted', 'warm', 'cool']
-        colors_found = [c for c in colors_found if c not in non_colors]
-        
-        return colors_found[:5]  # Return top 5 colors
+        text_lower = ctx.text_lower
+        
+        # Direct color mentions first, then color descriptions in text order;
+        # the description scan stops once 5 distinct colors are found
+        candidates = chain(
+            (color_name for color_name in self.color_names if color_name in text_lower),
+            (match[match.lastindex] for match in _COLOR_RE.finditer(text_lower))
+        )
+        
+        # Remove duplicates and common non-colors, keeping the order found
+        colors_found = {}
+        for color in candidates:
+            if color not in _NON_COLORS:
+                colors_found[color] = None
+                if len(colors_found) == 5:  # Return top 5 colors
+                    break
+        
+        return list(colors_found)
     
-    def _extract_style(self, text: str) -> Optional[str]:
+    def _extract_style(self, ctx: _ParseCtx) -> Optional[str]:
         """Extract artistic style information"""
-        style_keywords = [
-            # Historical periods
-            'renaissance', 'baroque', 'rococo', 'neoclassical', 'romantic', 'realist',
-            'impressionist', 'post-impressionist', 'expressionist', 'cubist', 'surrealist',
-            'abstract', 'modern', 'contemporary', 'medieval', 'gothic', 'byzantine',
-            
-            # Specific styles
-            'realistic', 'abstract', 'figurative', 'geometric', 'organic',
-            'minimalist', 'maximalist', 'decorative', 'ornate', 'simple',
-            'classical', 'traditional', 'avant-garde', 'experimental'
-        ]
-        
-        text_lower = text.lower()
-        for keyword in style_keywords:
-            if keyword in text_lower:
-                # Find the sentence containing the style
-                sentences = text.split('.')
-                for sentence in sentences:
-                    if keyword in sentence.lower():
-                        return sentence.strip()
+        found = ctx.hits['style']
+        if found:
+            # The earliest-listed style present picks the sentence
+            return ctx.sentence(found[_earliest_listed('style', found)])
         
         return None
     
-    def _extract_medium(self, text: str) -> Optional[str]:
+    def _extract_medium(self, ctx: _ParseCtx) -> Optional[str]:
         """Extract medium/material information"""
-        medium_keywords = [
-            'oil painting', 'oil on canvas', 'acrylic', 'watercolor', 'tempera',
-            'fresco', 'pastel', 'charcoal', 'pencil', 'ink', 'gouache',
-            'canvas', 'wood', 'panel', 'paper', 'silk', 'metal',
-            'sculpture', 'bronze', 'marble', 'stone', 'clay', 'ceramic',
-            'photograph', 'print', 'etching', 'lithograph', 'woodcut',
-            'mixed media', 'collage', 'assemblage'
-        ]
-        
-        text_lower = text.lower()
-        for keyword in medium_keywords:
-            if keyword in text_lower:
-                return keyword
+        found = ctx.hits['medium']
+        if found:
+            return _earliest_listed('medium', found)
         
         return None
     
-    def _extract_technique(self, text: str) -> Optional[str]:
+    def _extract_technique(self, ctx: _ParseCtx) -> Optional[str]:
         """Extract technique information"""
-        technique_keywords = [
-            'brushwork', 'brushstrokes', 'impasto', 'glazing', 'scumbling',
-            'alla prima', 'wet-on-wet', 'dry brush', 'stippling', 'cross-hatching',
-            'blending', 'layering', 'underpainting', 'overpainting',
-            'chiaroscuro', 'sfumato', 'tenebrism', 'pointillism'
-        ]
-        
-        sentences = text.split('.')
-        for sentence in sentences:
-            if any(keyword in sentence.lower() for keyword in technique_keywords):
-                return sentence.strip()
-        
-        return None
+        return self._find_info_by_keywords(ctx, ctx.hits['technique'])
     
-    def _extract_subject_matter(self, text: str) -> List[str]:
+    def _extract_subject_matter(self, ctx: _ParseCtx) -> List[str]:
         """Extract subject matter"""
-        subject_keywords = [
-            'portrait', 'landscape', 'still life', 'figure', 'nude', 'religious',
-            'mythological', 'historical', 'genre scene', 'interior', 'exterior',
-            'animal', 'flower', 'tree', 'building', 'architecture',
-            'person', 'woman', 'man', 'child', 'group', 'crowd'
-        ]
-        
-        subjects_found = []
-        text_lower = text.lower()
-        
-        for keyword in subject_keywords:
-            if keyword in text_lower:
-                subjects_found.append(keyword)
-        
-        return list(set(subjects_found))
+        return list(ctx.hits['subject_matter'])
     
-    def _extract_formal_elements(self, text: str) -> Dict[str, str]:
+    def _extract_formal_elements(self, ctx: _ParseCtx) -> Dict[str, str]:
         """Extract formal elements (line, shape, form, space, etc.)"""
         elements = {}
         
-        # Line
-        line_keywords = ['line', 'linear', 'contour', 'outline', 'curved', 'straight', 'diagonal']
-        line_info = self._find_info_by_keywords(text, line_keywords)
-        if line_info:
-            elements['line'] = line_info
-        
-        # Shape
-        shape_keywords = ['shape', 'circular', 'rectangular', 'triangular', 'organic', 'geometric']
-        shape_info = self._find_info_by_keywords(text, shape_keywords)
-        if shape_info:
-            elements['shape'] = shape_info
-        
-        # Form
-        form_keywords = ['form', 'volume', 'mass', 'three-dimensional', '3d', 'dimensional']
-        form_info = self._find_info_by_keywords(text, form_keywords)
-        if form_info:
-            elements['form'] = form_info
-        
-        # Space
-        space_keywords = ['space', 'spatial', 'depth', 'foreground', 'background', 'middle ground']
-        space_info = self._find_info_by_keywords(text, space_keywords)
-        if space_info:
-            elements['space'] = space_info
+        for element in _FORMAL_ELEMENTS:
+            info = self._find_info_by_keywords(ctx, ctx.hits[element])
+            if info:
+                elements[element] = info
         
         return elements
     
-    def _extract_lighting(self, text: str) -> Optional[str]:
+    def _extract_lighting(self, ctx: _ParseCtx) -> Optional[str]:
         """Extract lighting information"""
-        lighting_keywords = [
-            'lighting', 'light', 'shadow', 'bright', 'dark', 'illuminated',
-            'dramatic lighting', 'soft light', 'harsh light', 'natural light',
-            'artificial light', 'backlighting', 'side lighting', 'front lighting',
-            'chiaroscuro', 'tenebrism', 'luminous', 'glowing', 'radiant'
-        ]
-        
-        return self._find_info_by_keywords(text, lighting_keywords)
+        return self._find_info_by_keywords(ctx, ctx.hits['lighting'])
     
-    def _extract_perspective(self, text: str) -> Optional[str]:
+    def _extract_perspective(self, ctx: _ParseCtx) -> Optional[str]:
         """Extract perspective information"""
-        perspective_keywords = [
-            'perspective', 'linear perspective', 'atmospheric perspective',
-            'one-point perspective', 'two-point perspective', 'three-point perspective',
-            'bird\'s eye view', 'worm\'s eye view', 'eye level', 'high angle', 'low angle',
-            'vanishing point', 'horizon line', 'foreshortening'
-        ]
-        
-        return self._find_info_by_keywords(text, perspective_keywords)
+        return self._find_info_by_keywords(ctx, ctx.hits['perspective'])
     
-    def _extract_texture(self, text: str) -> Optional[str]:
+    def _extract_texture(self, ctx: _ParseCtx) -> Optional[str]:
         """Extract texture information"""
-        texture_keywords = [
-            'texture', 'textured', 'smooth', 'rough', 'coarse', 'fine',
-            'grainy', 'silky', 'glossy', 'matte', 'bumpy', 'ridged',
-            'fabric', 'skin', 'hair', 'fur', 'metal', 'wood grain'
-        ]
-        
-        return self._find_info_by_keywords(text, texture_keywords)
+        return self._find_info_by_keywords(ctx, ctx.hits['texture'])
     
-    def _extract_mood(self, text: str) -> Optional[str]:
+    def _extract_mood(self, ctx: _ParseCtx) -> Optional[str]:
         """Extract mood/emotional content"""
-        mood_keywords = [
-            'mood', 'emotion', 'feeling', 'atmosphere', 'ambiance',
-            'serene', 'peaceful', 'calm', 'tranquil', 'dramatic', 'intense',
-            'melancholic', 'joyful', 'somber', 'mysterious', 'energetic',
-            'contemplative', 'spiritual', 'romantic', 'nostalgic', 'powerful'
-        ]
-        
-        return self._find_info_by_keywords(text, mood_keywords)
+        return self._find_info_by_keywords(ctx, ctx.hits['mood'])
     
-    def _find_info_by_keywords(self, text: str, keywords: List[str]) -> Optional[str]:
-        """Helper function to find information related to specific keywords"""
-        sentences = text.split('.')
-        for sentence in sentences:
-            if any(keyword in sentence.lower() for keyword in keywords):
-                return sentence.strip()
+    def _find_info_by_keywords(self, ctx: _ParseCtx, found: Dict[str, int]) -> Optional[str]:
+        """Helper function to return the first sentence containing any of the found keywords"""
+        if found:
+            # Keywords are recorded in order of occurrence, so the first one has the earliest sentence
+            return ctx.sentence(next(iter(found.values())))
         return None
     
     def analyze_color_harmony(self, colors: List[str]) -> Dict[str, Any]:
@@ -273,12 +435,9 @@ class VisionAnalysisTools:
     
     def _assess_color_temperature(self, colors: List[str]) -> str:
         """Assess overall color temperature"""
-        warm_colors = ['red', 'orange', 'yellow', 'brown', 'gold']
-        cool_colors = ['blue', 'green', 'purple', 'silver']
-        neutral_colors = ['black', 'white', 'gray', 'grey']
-        
-        warm_count = sum(1 for color in colors if color in warm_colors)
-        cool_count = sum(1 for color in colors if color in cool_colors)
+        # map() with the bound membership test counts in C, with no generator frame per color
+        warm_count = sum(map(_WARM_COLORS.__contains__, colors))
+        cool_count = sum(map(_COOL_COLORS.__contains__, colors))
         
         if warm_count > cool_count:
             return 'warm'
@@ -290,11 +449,8 @@ class VisionAnalysisTools:
     def _assess_color_intensity(self, colors: List[str]) -> str:
         """Assess color intensity/saturation level"""
         # This is a simplified assessment based on color names
-        high_intensity = ['red', 'blue', 'yellow', 'orange', 'purple', 'green']
-        low_intensity = ['brown', 'gray', 'grey', 'beige', 'cream']
-        
-        high_count = sum(1 for color in colors if color in high_intensity)
-        low_count = sum(1 for color in colors if color in low_intensity)
+        high_count = sum(map(_HIGH_INTENSITY_COLORS.__contains__, colors))
+        low_count = sum(map(_LOW_INTENSITY_COLORS.__contains__, colors))
         
         if high_count > low_count:
             return 'vibrant'
@@ -306,40 +462,23 @@ class VisionAnalysisTools:
     def _identify_color_schemes(self, colors: List[str]) -> List[str]:
         """Identify potential color schemes"""
         schemes = []
+        color_set = set(colors)
         
         # Monochromatic (variations of same color)
-        if len(set(colors)) <= 2:
+        if len(color_set) <= 2:
             schemes.append('monochromatic')
         
         # Complementary pairs
-        complementary_pairs = [
-            ('red', 'green'), ('blue', 'orange'), ('yellow', 'purple')
-        ]
-        for pair in complementary_pairs:
-            if all(color in colors for color in pair):
-                schemes.append('complementary')
-                break
+        if any(pair <= color_set for pair in _COMPLEMENTARY_PAIRS):
+            schemes.append('complementary')
         
-        # Analogous (adjacent colors)
-        analogous_groups = [
-            ['red', 'orange', 'yellow'],
-            ['blue', 'green', 'purple'],
-            ['yellow', 'green', 'blue']
-        ]
-        for group in analogous_groups:
-            if len([color for color in colors if color in group]) >= 2:
-                schemes.append('analogous')
-                break
+        # Analogous (adjacent colors); repeated colors count again
+        if any(sum(map(group.__contains__, colors)) >= 2 for group in _ANALOGOUS_GROUPS):
+            schemes.append('analogous')
         
         # Triadic
-        triadic_sets = [
-            ['red', 'blue', 'yellow'],
-            ['orange', 'green', 'purple']
-        ]
-        for triad in triadic_sets:
-            if all(color in colors for color in triad):
-                schemes.append('triadic')
-                break
+        if any(triad <= color_set for triad in _TRIADIC_SETS):
+            schemes.append('triadic')
         
         return schemes if schemes else ['custom']
     
@@ -405,7 +544,7 @@ class VisionAnalysisTools:
         comp2 = elements2.get('composition', '').lower()
         
         if comp1 and comp2:
-            common_comp_words = set(comp1.split()).intersection(set(comp2.split()))
+            common_comp_words = _word_set(comp1) & _word_set(comp2)
             if len(common_comp_words) > 2:  # More than just articles/prepositions
                 comparison['similarities'].append("Similar compositional approaches")
             else:
@@ -417,45 +556,29 @@ class VisionAnalysisTools:
         """Extract technical painting/artistic details"""
         details = {}
         
-        # Brushwork analysis
-        brushwork_patterns = [
-            r'brush(?:work|stroke)s?\s+(?:are|is)?\s*([^.]+)',
-            r'(?:thick|thin|bold|delicate|loose|tight)\s+(?:brush|stroke)s?',
-            r'impasto|glazing|scumbling|alla prima'
-        ]
+        ctx = self._parse_context_cached(visual_analysis)
         
+        # Brushwork analysis
         brushwork_info = []
-        for pattern in brushwork_patterns:
-            matches = re.findall(pattern, visual_analysis.lower())
-            brushwork_info.extend(matches)
+        for pattern in _BRUSHWORK_RES:
+            brushwork_info.extend(pattern.findall(ctx.text_lower))
         
         if brushwork_info:
             details['brushwork'] = ' '.join(brushwork_info[:2])
         
         # Canvas/support information
-        support_keywords = ['canvas', 'wood', 'panel', 'paper', 'board', 'copper', 'silk']
-        for keyword in support_keywords:
-            if keyword in visual_analysis.lower():
-                details['support'] = keyword
-                break
+        if ctx.hits['support']:
+            details['support'] = _earliest_listed('support', ctx.hits['support'])
         
         # Size references
-        size_patterns = [
-            r'(?:large|small|medium|huge|tiny|massive|miniature)\s+(?:scale|size|work|painting)',
-            r'(?:monumental|intimate|grand|modest)\s+(?:scale|proportions?)'
-        ]
-        
-        for pattern in size_patterns:
-            match = re.search(pattern, visual_analysis.lower())
+        for pattern in _SIZE_RES:
+            match = pattern.search(ctx.text_lower)
             if match:
                 details['scale'] = match.group()
                 break
         
         # Condition/preservation
-        condition_keywords = ['restored', 'damaged', 'pristine', 'aged', 'cracked', 'faded', 'well-preserved']
-        for keyword in condition_keywords:
-            if keyword in visual_analysis.lower():
-                details['condition'] = keyword
-                break
+        if ctx.hits['condition']:
+            details['condition'] = _earliest_listed('condition', ctx.hits['condition'])
         
         return details
\ No newline at end of file